@@ -12,9 +12,29 @@ import sys
 from PyQt6.QtWidgets import QApplication
 from src.ui.login_window import LoginWindow
 
+# アプリケーション全体のスタイルシート（起動時に一度だけ適用）
+# ログインボタンとメイン画面の更新ボタンは同じ緑色のスタイル
+APP_QSS = """
+    QPushButton#loginButton, QPushButton#refreshButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#loginButton:hover, QPushButton#refreshButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton#loginButton:pressed, QPushButton#refreshButton:pressed {
+        background-color: #3d8b40;
+    }
+"""
+
 def main():
     """アプリケーションのメインエントリーポイント"""
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_QSS)
     login_window = LoginWindow()
     login_window.show()
     sys.exit(app.exec())
@@ -15,15 +15,222 @@
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
                            QLabel, QLineEdit, QPushButton, QMessageBox,
-                           QDialog, QHBoxLayout)
-from PyQt6.QtCore import Qt
-from .main_window import MainWindow
+                           QDialog, QHBoxLayout, QLayout)
+from PyQt6.QtCore import QThreadPool, QTimer
 from ..utils.credentials_manager import CredentialsManager
+from .worker import Task
 import json
 import os
-from cryptography.fernet import Fernet
+import re
+import hmac
+import hashlib
+import time
+import threading
+from base64 import b64encode, b64decode, urlsafe_b64decode
+from functools import lru_cache
+from cryptography.exceptions import InvalidKey, InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 from pathlib import Path
 
+try:
+    from orjson import dumps as _dumps_json, loads as _loads_json
+except ImportError:
+    # orjsonが利用できない環境では標準ライブラリのjsonを使用
+    # （空白なしで出力し、暗号化するバイト数を抑える。非ASCII文字はエスケープされるため
+    # orjsonとバイト列は一致しない場合があるが、どちらの実装でも同じ値として読み込める）
+    def _dumps_json(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True).encode('ascii')
+    _loads_json = json.loads
+
+# アプリケーションのデータディレクトリ
+_APP_DIR = Path.home() / '.password_manager'
+
+# ユーザーデータファイルの暗号化形式（AES-GCM）で使用するノンス長
+_NONCE_SIZE = 12
+
+# パスワードハッシュ（scrypt）のパラメータ
+# nはレコードごとに保存し、変更前のハッシュも検証できるようにする
+_SCRYPT_N = 2**15
+_LEGACY_SCRYPT_N = 2**14
+_SCRYPT_R = 8
+_SCRYPT_P = 1
+_SCRYPT_LENGTH = 32
+_SALT_SIZE = 16
+
+# ユーザーデータファイルへの書き込みをまとめる間隔（ミリ秒）
+_SAVE_DELAY_MS = 100
+
+# ユーザー名に使用できる文字（英数字、アンダースコア、ハイフン）
+_USERNAME_RE = re.compile(r'\A[A-Za-z0-9_\-]+\Z')
+
+# 入力フィールドの最大文字数
+_MAX_USERNAME_LENGTH = 64
+_MAX_PASSWORD_LENGTH = 256
+_MAX_ACCESS_KEY_LENGTH = 128
+_MAX_SECRET_KEY_LENGTH = 128
+
+# パスワード入力欄のエコーモード
+_ECHO_PWD = QLineEdit.EchoMode.Password
+_ECHO_NORMAL = QLineEdit.EchoMode.Normal
+
+# ログイン失敗時のロック時間（秒）。失敗回数に応じて指数的に延長
+_LOCKOUT_BASE_SECONDS = 1
+_LOCKOUT_MAX_SECONDS = 15 * 60
+
+# 鍵ファイルの生成・読み込みの排他制御
+_KEY_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _load_key():
+    """
+    ユーザー情報の暗号化に使用する鍵を読み込む
+
+    Returns:
+        bytes: Fernet形式の鍵
+
+    Note:
+        - 鍵ファイルが存在しない場合は新規に生成されます
+        - 鍵の読み込みはプロセスごとに1回のみ行われます
+        - ワーカースレッドから同時に呼ばれても鍵が二重に生成されないよう排他制御します
+    """
+    with _KEY_LOCK:
+        key_file = _APP_DIR / 'key.key'
+        try:
+            return key_file.read_bytes()
+        except FileNotFoundError:
+            # 初回のみディレクトリを作成（ユーザーデータファイルの書き込みは必ず鍵の読み込み後に行われる）
+            key = Fernet.generate_key()
+            key_file.parent.mkdir(parents=True, exist_ok=True)
+            key_file.write_bytes(key)
+            return key
+
+@lru_cache(maxsize=1)
+def _get_cipher_suite():
+    """
+    旧形式（Fernet）のユーザー情報の復号に使用するオブジェクトを取得
+
+    Returns:
+        Fernet: 暗号化/復号化オブジェクト
+    """
+    return Fernet(_load_key())
+
+@lru_cache(maxsize=1)
+def _get_aead():
+    """
+    ユーザー情報の暗号化に使用するAES-GCMオブジェクトを取得
+
+    Returns:
+        AESGCM: 認証付き暗号化/復号化オブジェクト
+
+    Note:
+        既存の鍵ファイルからHKDFで256ビットの鍵を導出します。
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b'password-manager-users',
+    )
+    return AESGCM(hkdf.derive(urlsafe_b64decode(_load_key())))
+
+def _hash_password(password: str) -> dict:
+    """
+    パスワードのハッシュを生成
+
+    Args:
+        password (str): 平文のパスワード
+
+    Returns:
+        dict: ソルトとハッシュ（Base64エンコード済み）、ログイン失敗状態を含む辞書
+            {
+                'salt': str,
+                'hash': str,
+                'n': int,
+                'fails': int,
+                'locked_until': float
+            }
+    """
+    salt = os.urandom(_SALT_SIZE)
+    kdf = Scrypt(salt=salt, length=_SCRYPT_LENGTH, n=_SCRYPT_N, r=_SCRYPT_R, p=_SCRYPT_P)
+    return {
+        'salt': b64encode(salt).decode(),
+        'hash': b64encode(kdf.derive(password.encode())).decode(),
+        'n': _SCRYPT_N,
+        'fails': 0,
+        'locked_until': 0
+    }
+
+def _verify_password(record, password: str) -> bool:
+    """
+    パスワードをハッシュと照合
+
+    Args:
+        record (dict | str): 保存されているユーザー情報。旧形式では平文のパスワード
+        password (str): 入力されたパスワード
+
+    Returns:
+        bool: パスワードが一致する場合はTrue、それ以外はFalse
+    """
+    if isinstance(record, str):
+        # 旧形式（平文）のデータ
+        return hmac.compare_digest(record.encode(), password.encode())
+    
+    kdf = Scrypt(salt=b64decode(record['salt']), length=_SCRYPT_LENGTH,
+                 n=record.get('n', _LEGACY_SCRYPT_N), r=_SCRYPT_R, p=_SCRYPT_P)
+    try:
+        kdf.verify(password.encode(), b64decode(record['hash']))
+        return True
+    except InvalidKey:
+        return False
+
+def _user_file_name(username: str) -> str:
+    """
+    ユーザーデータファイルの名前を取得
+
+    Args:
+        username (str): ユーザー名
+
+    Returns:
+        str: ユーザー名のSHA-256ハッシュ（16進数）に拡張子を付けたファイル名
+
+    Note:
+        ファイル名からユーザー名が分からないようにハッシュ化します。
+    """
+    return hashlib.sha256(username.encode('utf-8')).hexdigest() + '.dat'
+
+def _add_all(layout: QLayout, *items):
+    """
+    ウィジェットとレイアウトをまとめてレイアウトに追加
+
+    Args:
+        layout (QLayout): 追加先のレイアウト
+        *items (QWidget | QLayout): 追加するウィジェットまたはレイアウト（追加順）
+    """
+    add_widget = layout.addWidget
+    add_layout = layout.addLayout
+    for item in items:
+        if isinstance(item, QLayout):
+            add_layout(item)
+        else:
+            add_widget(item)
+
+@lru_cache(maxsize=1)
+def _get_dummy_record() -> dict:
+    """
+    未登録ユーザーのログイン時に検証に使用するダミーのユーザー情報を取得
+
+    Returns:
+        dict: ランダムなパスワードから生成したユーザー情報
+
+    Note:
+        LoginWindowの初期化時にワーカースレッドで生成され、以降はキャッシュを返します。
+    """
+    return _hash_password(b64encode(os.urandom(_SALT_SIZE)).decode())
+
 class RegisterDialog(QDialog):
     def __init__(self, parent=None):
         """
@@ -43,83 +250,74 @@ class RegisterDialog(QDialog):
         self.setWindowTitle('新規ユーザー登録')
         self.setFixedSize(400, 350)
         
-        layout = QVBoxLayout()
-        
         # ユーザー名
-        username_label = QLabel('ユーザー名:')
         self.username_input = QLineEdit()
+        self.username_input.setMaxLength(_MAX_USERNAME_LENGTH)
         self.username_input.setPlaceholderText('ユーザー名を入力')
-        layout.addWidget(username_label)
-        layout.addWidget(self.username_input)
         
         # パスワード
-        password_label = QLabel('パスワード:')
-        layout.addWidget(password_label)
-        
-        password_layout = QHBoxLayout()
-        self.password_input = QLineEdit()
-        self.password_input.setPlaceholderText('パスワードを入力')
-        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        password_layout.addWidget(self.password_input)
-        
-        show_password_btn = QPushButton("表示")
-        show_password_btn.setFixedWidth(60)
-        show_password_btn.clicked.connect(lambda: self.toggle_password_visibility(self.password_input))
-        password_layout.addWidget(show_password_btn)
-        layout.addLayout(password_layout)
+        self.password_input, password_layout = self._make_password_row(
+            'パスワードを入力', _MAX_PASSWORD_LENGTH)
         
         # パスワード確認
-        password_confirm_label = QLabel('パスワード（確認）:')
-        layout.addWidget(password_confirm_label)
-        
-        password_confirm_layout = QHBoxLayout()
-        self.password_confirm_input = QLineEdit()
-        self.password_confirm_input.setPlaceholderText('パスワードを再入力')
-        self.password_confirm_input.setEchoMode(QLineEdit.EchoMode.Password)
-        password_confirm_layout.addWidget(self.password_confirm_input)
-        
-        show_password_confirm_btn = QPushButton("表示")
-        show_password_confirm_btn.setFixedWidth(60)
-        show_password_confirm_btn.clicked.connect(lambda: self.toggle_password_visibility(self.password_confirm_input))
-        password_confirm_layout.addWidget(show_password_confirm_btn)
-        layout.addLayout(password_confirm_layout)
+        self.password_confirm_input, password_confirm_layout = self._make_password_row(
+            'パスワードを再入力', _MAX_PASSWORD_LENGTH)
         
         # AWSアクセスキー
-        access_key_label = QLabel('AWSアクセスキー:')
         self.access_key_input = QLineEdit()
+        self.access_key_input.setMaxLength(_MAX_ACCESS_KEY_LENGTH)
         self.access_key_input.setPlaceholderText('AWSアクセスキーを入力')
-        layout.addWidget(access_key_label)
-        layout.addWidget(self.access_key_input)
         
         # AWSシークレットキー
-        secret_key_label = QLabel('AWSシークレットキー:')
-        layout.addWidget(secret_key_label)
-        
-        secret_key_layout = QHBoxLayout()
-        self.secret_key_input = QLineEdit()
-        self.secret_key_input.setPlaceholderText('AWSシークレットキーを入力')
-        self.secret_key_input.setEchoMode(QLineEdit.EchoMode.Password)
-        secret_key_layout.addWidget(self.secret_key_input)
-        
-        show_secret_key_btn = QPushButton("表示")
-        show_secret_key_btn.setFixedWidth(60)
-        show_secret_key_btn.clicked.connect(lambda: self.toggle_password_visibility(self.secret_key_input))
-        secret_key_layout.addWidget(show_secret_key_btn)
-        layout.addLayout(secret_key_layout)
+        self.secret_key_input, secret_key_layout = self._make_password_row(
+            'AWSシークレットキーを入力', _MAX_SECRET_KEY_LENGTH)
         
         # ボタン
-        button_layout = QHBoxLayout()
         register_button = QPushButton('登録')
         register_button.clicked.connect(self.validate_and_accept)
         cancel_button = QPushButton('キャンセル')
         cancel_button.clicked.connect(self.reject)
         
-        button_layout.addWidget(register_button)
-        button_layout.addWidget(cancel_button)
-        layout.addLayout(button_layout)
+        button_layout = QHBoxLayout()
+        _add_all(button_layout, register_button, cancel_button)
         
+        layout = QVBoxLayout()
+        _add_all(
+            layout,
+            QLabel('ユーザー名:'), self.username_input,
+            QLabel('パスワード:'), password_layout,
+            QLabel('パスワード（確認）:'), password_confirm_layout,
+            QLabel('AWSアクセスキー:'), self.access_key_input,
+            QLabel('AWSシークレットキー:'), secret_key_layout,
+            button_layout
+        )
         self.setLayout(layout)
 
+    def _make_password_row(self, placeholder: str, max_length: int):
+        """
+        表示切り替えボタン付きのパスワード入力行を作成
+
+        Args:
+            placeholder (str): 入力フィールドのプレースホルダー
+            max_length (int): 入力できる最大文字数
+
+        Returns:
+            tuple: (入力フィールド, 入力フィールドとボタンを配置したレイアウト)
+        """
+        input_field = QLineEdit()
+        input_field.setMaxLength(max_length)
+        input_field.setPlaceholderText(placeholder)
+        input_field.setEchoMode(_ECHO_PWD)
+        
+        show_button = QPushButton("表示")
+        show_button.setFixedWidth(60)
+        show_button.clicked.connect(lambda _, f=input_field: self.toggle_password_visibility(f))
+        
+        row = QHBoxLayout()
+        row.addWidget(input_field)
+        row.addWidget(show_button)
+        return input_field, row
+
     def toggle_password_visibility(self, input_field: QLineEdit):
         """
         パスワードの表示/非表示を切り替え
@@ -127,10 +325,8 @@ class RegisterDialog(QDialog):
         Args:
             input_field (QLineEdit): 表示/非表示を切り替える入力フィールド
         """
-        if input_field.echoMode() == QLineEdit.EchoMode.Password:
-            input_field.setEchoMode(QLineEdit.EchoMode.Normal)
-        else:
-            input_field.setEchoMode(QLineEdit.EchoMode.Password)
+        hidden = input_field.echoMode() == _ECHO_PWD
+        input_field.setEchoMode(_ECHO_NORMAL if hidden else _ECHO_PWD)
 
     def validate_and_accept(self):
         """
@@ -158,7 +354,7 @@ class RegisterDialog(QDialog):
             return
         
         # ユーザー名の文字チェック
-        if not all(c.isalnum() or c in '_-' for c in username):
+        if not _USERNAME_RE.match(username):
             QMessageBox.warning(self, "エラー", 
                               "ユーザー名には英数字とアンダースコア、ハイフンのみ使用できます。")
             return
@@ -201,34 +397,33 @@ class AWSCredentialsDialog(QDialog):
         self.setWindowTitle('AWS認証情報の設定')
         self.setFixedSize(400, 200)
         
-        layout = QVBoxLayout()
-        
         # アクセスキー
-        access_key_label = QLabel('AWSアクセスキー:')
         self.access_key_input = QLineEdit()
+        self.access_key_input.setMaxLength(_MAX_ACCESS_KEY_LENGTH)
         self.access_key_input.setPlaceholderText('AWSアクセスキーを入力')
-        layout.addWidget(access_key_label)
-        layout.addWidget(self.access_key_input)
         
         # シークレットキー
-        secret_key_label = QLabel('AWSシークレットキー:')
         self.secret_key_input = QLineEdit()
+        self.secret_key_input.setMaxLength(_MAX_SECRET_KEY_LENGTH)
         self.secret_key_input.setPlaceholderText('AWSシークレットキーを入力')
-        self.secret_key_input.setEchoMode(QLineEdit.EchoMode.Password)
-        layout.addWidget(secret_key_label)
-        layout.addWidget(self.secret_key_input)
+        self.secret_key_input.setEchoMode(_ECHO_PWD)
         
         # ボタン
-        button_layout = QHBoxLayout()
         save_button = QPushButton('保存')
         save_button.clicked.connect(self.accept)
         cancel_button = QPushButton('キャンセル')
         cancel_button.clicked.connect(self.reject)
         
-        button_layout.addWidget(save_button)
-        button_layout.addWidget(cancel_button)
-        layout.addLayout(button_layout)
+        button_layout = QHBoxLayout()
+        _add_all(button_layout, save_button, cancel_button)
         
+        layout = QVBoxLayout()
+        _add_all(
+            layout,
+            QLabel('AWSアクセスキー:'), self.access_key_input,
+            QLabel('AWSシークレットキー:'), self.secret_key_input,
+            button_layout
+        )
         self.setLayout(layout)
     
     def get_credentials(self):
@@ -256,9 +451,11 @@ class LoginWindow(QMainWindow):
             credentials_manager (CredentialsManager): AWS認証情報管理オブジェクト
             username_input (QLineEdit): ユーザー名入力フィールド
             password_input (QLineEdit): パスワード入力フィールド
+            show_password_button (QPushButton): パスワード表示切り替えボタン
+            login_button (QPushButton): ログインボタン
+            register_button (QPushButton): 新規登録ボタン
             login_attempts (int): ログイン試行回数
             max_attempts (int): 最大ログイン試行回数
-            cipher_suite (Fernet): 暗号化/復号化オブジェクト
         """
         super().__init__()
         self.setWindowTitle("パスワードマネージャー - ログイン")
@@ -266,38 +463,38 @@ class LoginWindow(QMainWindow):
         
         # 認証情報マネージャーの初期化
         self.credentials_manager = CredentialsManager()
+        self._aws_creds_ok = False
+        self._aws_dialog = None
+        self._msgbox = None
         
-        # メインウィジェットとレイアウトの設定
-        main_widget = QWidget()
-        self.setCentralWidget(main_widget)
+        # メインレイアウト（ウィジェットへの設定は要素の追加後に行う）
         layout = QVBoxLayout()
-        main_widget.setLayout(layout)
         
         # ユーザー名入力
-        username_label = QLabel('ユーザー名:')
         self.username_input = QLineEdit()
+        self.username_input.setMaxLength(_MAX_USERNAME_LENGTH)
         self.username_input.returnPressed.connect(self.on_return_pressed)
-        layout.addWidget(username_label)
-        layout.addWidget(self.username_input)
         
         # パスワード入力
-        password_label = QLabel('パスワード:')
         self.password_input = QLineEdit()
-        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.password_input.setMaxLength(_MAX_PASSWORD_LENGTH)
+        self.password_input.setEchoMode(_ECHO_PWD)
         self.password_input.returnPressed.connect(self.on_return_pressed)
-        layout.addWidget(password_label)
+        
+        # パスワード表示/非表示切り替えボタン
+        self.show_password_button = QPushButton('表示')
+        self.show_password_button.setFixedWidth(60)
+        self.show_password_button.clicked.connect(self.toggle_password_visibility)
         
         # パスワード入力欄とトグルボタンを水平に配置
         password_layout = QHBoxLayout()
-        password_layout.addWidget(self.password_input)
+        _add_all(password_layout, self.password_input, self.show_password_button)
         
-        # パスワード表示/非表示切り替えボタン
-        show_password_button = QPushButton('表示')
-        show_password_button.setFixedWidth(60)
-        show_password_button.clicked.connect(self.toggle_password_visibility)
-        password_layout.addWidget(show_password_button)
-        
-        layout.addLayout(password_layout)
+        _add_all(
+            layout,
+            QLabel('ユーザー名:'), self.username_input,
+            QLabel('パスワード:'), password_layout
+        )
         
         # スペースを追加
         layout.addSpacing(10)
@@ -306,166 +503,470 @@ class LoginWindow(QMainWindow):
         button_layout = QHBoxLayout()
         
         # 新規登録ボタン（左）
-        register_button = QPushButton('新規登録')
-        register_button.clicked.connect(self.show_register_dialog)
-        register_button.setFixedWidth(100)
-        button_layout.addWidget(register_button)
+        self.register_button = QPushButton('新規登録')
+        self.register_button.clicked.connect(self.show_register_dialog)
+        self.register_button.setFixedWidth(100)
+        button_layout.addWidget(self.register_button)
         
         # スペーサーを追加（ログインボタンを右寄せ）
         button_layout.addStretch()
         
         # ログインボタン（右）
-        login_button = QPushButton('ログイン')
-        login_button.clicked.connect(self.login)
-        login_button.setFixedWidth(120)
-        login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        button_layout.addWidget(login_button)
+        self.login_button = QPushButton('ログイン')
+        # clickedのchecked引数がユーザー名として渡らないようにする
+        self.login_button.clicked.connect(lambda: self.login())
+        self.login_button.setFixedWidth(120)
+        # スタイルはアプリケーション全体のスタイルシート（src/main.py）で設定
+        self.login_button.setObjectName('loginButton')
+        button_layout.addWidget(self.login_button)
         
         layout.addLayout(button_layout)
         
+        # メインウィジェットの設定
+        # （完成したレイアウトを設定し、要素の追加ごとにレイアウトの再計算が起きないようにする）
+        main_widget = QWidget()
+        main_widget.setLayout(layout)
+        self.setCentralWidget(main_widget)
+        
         # ログイン試行回数の初期化
         self.login_attempts = 0
         self.max_attempts = 3
         
-        # 暗号化キーの設定
-        self.setup_encryption()
+        # ワーカースレッドで処理中のログイン・登録情報
+        self._pending_login = None
+        self._pending_registration = None
+        
+        # ユーザーデータファイルのディレクトリ（ユーザーごとに1ファイル）
+        self._users_dir = _APP_DIR / 'users'
+        self._users_migrated = False
+        self._migrate_lock = threading.Lock()
+        
+        # ユーザー情報のキャッシュ {username: ((更新時刻, サイズ), レコード)}
+        # （ファイルの更新時刻とサイズで有効性を判定）
+        self._users_cache = {}
+        
+        # 書き込み待ちのユーザー情報（短時間の連続保存をまとめて書き込む）
+        self._pending_users = {}
+        self._save_generation = 0
+        self._write_lock = threading.Lock()
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_users)
+        
+        # 未登録ユーザーの検証に使用するダミーのユーザー情報を事前に生成
+        # （初回の試行だけ応答時間が長くならないよう、ワーカースレッドで作成しておく）
+        QThreadPool.globalInstance().start(Task(_get_dummy_record))
+
+    @property
+    def cipher_suite(self):
+        """
+        旧形式（Fernet）データの復号化オブジェクト
 
-    def setup_encryption(self):
+        Note:
+            - 旧形式データの移行にのみ使用されます
+            - 鍵は最初にアクセスされた時点で読み込まれ、プロセス内で共有されます
         """
-        暗号化の初期設定
+        return _get_cipher_suite()
 
-        ユーザー情報の暗号化に使用する鍵の生成または読み込みを行います。
+    @property
+    def aead(self):
+        """
+        ユーザー情報の暗号化/復号化オブジェクト（AES-GCM）
 
         Note:
             - 鍵ファイルが存在しない場合は新規に生成されます
-            - 鍵は~/.password_manager/key.keyに保存されます
+            - 鍵は最初にアクセスされた時点（ワーカースレッドでの初回読み込み時）に
+              読み込まれるため、ウィンドウの表示は鍵の読み込みを待ちません
         """
-        key_file = Path.home() / '.password_manager' / 'key.key'
-        key_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        if not key_file.exists():
-            key = Fernet.generate_key()
-            with open(key_file, 'wb') as f:
-                f.write(key)
-        
-        with open(key_file, 'rb') as f:
-            self.key = f.read()
-        
-        self.cipher_suite = Fernet(self.key)
+        return _get_aead()
 
-    def get_user_data_path(self):
+    def get_user_data_path(self, username: str):
         """
         ユーザーデータファイルのパスを取得
 
+        Args:
+            username (str): ユーザー名
+
         Returns:
-            Path: ユーザーデータファイルのパス（~/.password_manager/users.dat）
+            Path: ユーザーデータファイルのパス
+                （~/.password_manager/users/<ユーザー名のSHA-256>.dat）
         """
-        return Path.home() / '.password_manager' / 'users.dat'
+        return self._users_dir / _user_file_name(username)
 
-    def load_users(self):
+    def load_user(self, username: str):
         """
-        保存されているユーザー情報を読み込む
+        ユーザー情報を読み込む
+
+        Args:
+            username (str): ユーザー名
 
         Returns:
-            dict: ユーザー名とパスワードのマッピング
-                {username: password}
+            dict | None: パスワードハッシュのレコード
+                {'salt': str, 'hash': str, 'n': int, 'fails': int, 'locked_until': float}
+                ユーザーが存在しない場合はNone
 
         Note:
-            - ファイルが存在しない場合は空の辞書を返します
-            - 復号化に失敗した場合は空の辞書を返します
+            - 指定したユーザーのファイルのみを復号化します
+            - 復号化に失敗した場合はNoneを返します
+            - 読み込み中のI/Oエラーなどはそのまま送出されます
+            - ファイルの更新時刻とサイズが前回と同じ場合はキャッシュを返します
+            - 旧形式（users.dat）のファイルは初回の読み込み時にユーザーごとのファイルへ移行します
+            - 書き込み待ちのデータがある場合はそれを返します
         """
+        if not self._users_migrated:
+            self._migrate_users()
+        
+        pending = self._pending_users.get(username)
+        if pending is not None:
+            return pending
+        
         try:
-            if not self.get_user_data_path().exists():
-                return {}
+            path = self.get_user_data_path(username)
+            
+            # ファイルが変更されていなければ復号済みのデータを再利用
+            st = path.stat()
+            cached = self._users_cache.get(username)
+            if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+                return cached[1]
             
-            with open(self.get_user_data_path(), 'rb') as f:
+            # キャッシュのキーは実際に読み込んだファイルから取得する
+            # （statと読み込みの間にファイルが置き換えられても不整合にならない）
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
                 encrypted_data = f.read()
-                decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-                return json.loads(decrypted_data)
-        except Exception:
-            return {}
+            
+            # ファイル名を関連データとして検証し、他のユーザーのファイルとの入れ替えを検出
+            view = memoryview(encrypted_data)
+            decrypted_data = self.aead.decrypt(
+                view[:_NONCE_SIZE], view[_NONCE_SIZE:], path.name.encode())
+            
+            record = _loads_json(decrypted_data)
+            self._users_cache[username] = ((st.st_mtime_ns, st.st_size), record)
+            return record
+        except FileNotFoundError:
+            return None
+        except (InvalidTag, ValueError):
+            # 改ざん・破損したファイル（ノンスより短いファイルや不正なJSONを含む）
+            return None
+
+    def _migrate_users(self):
+        """
+        旧形式（users.dat）のユーザー情報をユーザーごとのファイルへ移行
+
+        Note:
+            - users.datはAES-GCM形式と、さらに古いFernet形式のどちらにも対応します
+            - 全ユーザーの書き込み後にusers.datを削除します
+            - 復号化できない場合はusers.dat.invalidに名前を変更し、移行済みとして扱います
+            - ワーカースレッドから呼び出されるため、Qtのオブジェクトには触れません
+        """
+        with self._migrate_lock:
+            if self._users_migrated:
+                return
+            
+            legacy_path = _APP_DIR / 'users.dat'
+            try:
+                encrypted_data = legacy_path.read_bytes()
+            except FileNotFoundError:
+                self._users_migrated = True
+                return
+            
+            try:
+                try:
+                    view = memoryview(encrypted_data)
+                    decrypted_data = self.aead.decrypt(view[:_NONCE_SIZE], view[_NONCE_SIZE:], None)
+                except (InvalidTag, ValueError):
+                    decrypted_data = self.cipher_suite.decrypt(encrypted_data)
+                users = _loads_json(decrypted_data)
+            except (InvalidToken, ValueError) as e:
+                # 復号化できないファイルは退避し、ログインと登録を続けられるようにする
+                print(f"旧形式のユーザー情報を読み込めません: {e}")
+                legacy_path.replace(legacy_path.with_name('users.dat.invalid'))
+                self._users_migrated = True
+                return
+            
+            for username, record in users.items():
+                self._write_user(username, record)
+            
+            legacy_path.unlink()
+            self._users_migrated = True
 
-    def save_users(self, users):
+    def save_user(self, username: str, record):
         """
         ユーザー情報を保存
 
         Args:
-            users (dict): ユーザー名とパスワードのマッピング
-                {username: password}
+            username (str): ユーザー名
+            record (dict): パスワードハッシュのレコード
+                {'salt': str, 'hash': str, 'n': int, 'fails': int, 'locked_until': float}
 
         Note:
-            - データは暗号化されて保存されます
-            - 既存のデータは上書きされます
+            - 書き込みは短時間（100ミリ秒）の連続保存をまとめて、ワーカースレッドで行われます
+            - 書き込みが完了するまで、load_userは保存待ちのデータを返します
+        """
+        self._pending_users[username] = record
+        self._save_generation += 1
+        self._save_timer.start(_SAVE_DELAY_MS)
+
+    def _flush_users(self):
         """
-        encrypted_data = self.cipher_suite.encrypt(json.dumps(users).encode())
-        with open(self.get_user_data_path(), 'wb') as f:
-            f.write(encrypted_data)
+        書き込み待ちのユーザー情報をワーカースレッドで書き込む
+        """
+        if not self._pending_users:
+            return
+        
+        generation = self._save_generation
+        task = Task(self._write_users, dict(self._pending_users))
+        task.signals.finished.connect(lambda _: self._on_users_saved(generation))
+        task.signals.failed.connect(self._on_users_save_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_users_saved(self, generation):
+        """
+        ユーザー情報の書き込み完了時の処理
+
+        Args:
+            generation (int): 書き込んだデータの保存番号
 
-    def login(self):
+        Note:
+            書き込み中に新たな保存が行われていない場合のみ、書き込み待ちの状態を解除します。
+        """
+        if generation == self._save_generation:
+            self._pending_users.clear()
+
+    def _on_users_save_failed(self):
+        """ユーザー情報の書き込みに失敗した場合の処理"""
+        self._warn("ユーザー情報の保存に失敗しました。")
+
+    def _write_users(self, users):
+        """
+        複数のユーザー情報をまとめて書き込む
+
+        Args:
+            users (dict): ユーザー名とパスワードハッシュのレコードのマッピング
+        """
+        for username, record in users.items():
+            self._write_user(username, record)
+
+    def _write_user(self, username: str, record):
+        """
+        ユーザー情報を暗号化してファイルに書き込む
+
+        Args:
+            username (str): ユーザー名
+            record (dict): パスワードハッシュのレコード
+
+        Note:
+            - データはAES-GCMで暗号化されて保存されます（ノンス + 暗号文）
+            - 一時ファイルに書き込んでディスクに同期した後に置き換えるため、書き込み途中でファイルが壊れません
+            - ワーカースレッドから呼び出されるため、Qtのオブジェクトには触れません
+        """
+        path = self.get_user_data_path(username)
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = self.aead.encrypt(nonce, _dumps_json(record), path.name.encode())
+        
+        with self._write_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix('.dat.tmp')
+            # ノンスと暗号文を連結せずに順に書き込む
+            with open(tmp, 'wb') as f:
+                f.write(nonce)
+                f.write(ciphertext)
+                # 置き換え前にディスクへ書き出し、電源断などで空のファイルが残らないようにする
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+            
+            st = path.stat()
+            self._users_cache[username] = ((st.st_mtime_ns, st.st_size), record)
+
+    def _start_user_task(self, on_finished, func, *args):
+        """
+        ユーザー情報の読み込みと検証をワーカースレッドで開始
+
+        Args:
+            on_finished (Callable[[object], None]): 完了時に呼び出すスロット
+            func (Callable): ワーカースレッドで実行する関数
+            *args: funcに渡す引数
+
+        Note:
+            処理中はログインボタンと新規登録ボタンを無効化します。
+        """
+        self.login_button.setEnabled(False)
+        self.register_button.setEnabled(False)
+        
+        task = Task(func, *args)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(self._on_users_load_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_users_load_failed(self):
+        """ユーザー情報の読み込みに失敗した場合の処理"""
+        self._pending_login = None
+        self._pending_registration = None
+        self.login_button.setEnabled(True)
+        self.register_button.setEnabled(True)
+        self._show_message(QMessageBox.Icon.Critical, "エラー", "ユーザー情報の読み込みに失敗しました。")
+
+    def login(self, username=None, password=None):
         """
         ログイン処理を実行
 
-        ユーザー名とパスワードを検証し、正しい場合はメインウィンドウを表示します。
+        ユーザー情報の読み込みとパスワードの検証をワーカースレッドで開始します。
+        検証結果は _on_login_checked で処理されます。
+
+        Args:
+            username (str, optional): ユーザー名。省略時は入力欄から取得します
+            password (str, optional): パスワード。省略時は入力欄から取得します
 
         Note:
             - ログイン試行回数が上限に達した場合、アプリケーションは終了します
         """
-        username = self.username_input.text()
-        password = self.password_input.text()
+        if self._pending_login is not None:
+            return
+        
+        if username is None:
+            username = self.username_input.text()
+        if password is None:
+            password = self.password_input.text()
         
         if not username or not password:
-            QMessageBox.warning(self, "エラー", "ユーザー名とパスワードを入力してください。")
+            self._warn("ユーザー名とパスワードを入力してください。")
             return
         
-        users = self.load_users()
-        
         # ログイン試行回数のチェック
         if self.login_attempts >= self.max_attempts:
-            QMessageBox.critical(self, "エラー", "ログイン試行回数が上限に達しました。\nアプリケーションを終了します。")
+            self._show_message(QMessageBox.Icon.Critical, "エラー", "ログイン試行回数が上限に達しました。\nアプリケーションを終了します。")
             self.close()
             return
+        
+        self._pending_login = username
+        self._start_user_task(self._on_login_checked, self._check_login, username, password)
 
-        # ユーザーの存在チェック
-        if username not in users:
-            self.login_attempts += 1
-            remaining = self.max_attempts - self.login_attempts
-            QMessageBox.warning(
-                self,
-                "エラー",
-                f"ユーザー '{username}' は登録されていません。\n"
-                "新規登録ボタンから登録してください。\n"
-                f"残り試行回数: {remaining}"
-            )
-            return
+    def _check_login(self, username: str, password: str):
+        """
+        ユーザー情報を読み込んでパスワードを検証（ワーカースレッドで実行）
+
+        Args:
+            username (str): ユーザー名
+            password (str): 入力されたパスワード
+
+        Returns:
+            tuple: (検証結果, 読み込んだユーザー情報, 再ハッシュしたユーザー情報)
+                検証結果は 'ok'（成功）、'failed'（失敗）、'locked'（ロック中）のいずれか。
+                再ハッシュしたユーザー情報は、旧形式のパスワードでログインに成功した場合のみ設定されます。
+
+        Note:
+            scryptの計算はGUIスレッドを止めないよう、このワーカースレッドで行います。
+            ユーザー情報の更新と保存は、結果を受け取ったGUIスレッドで行います。
+        """
+        record = self.load_user(username)
         
-        # パスワードの検証
-        if users[username] != password:
-            self.login_attempts += 1
-            remaining = self.max_attempts - self.login_attempts
-            QMessageBox.warning(
-                self,
-                "エラー",
-                "パスワードが正しくありません。\n"
-                f"残り試行回数: {remaining}"
+        # アカウントのロック状態のチェック
+        # ロック中はパスワードを検証しないが、未登録のユーザーや失敗時と同じ計算量で
+        # ダミーの検証を行い、アカウントの存在を応答時間から推測させない
+        if isinstance(record, dict) and record.get('locked_until', 0) > time.time():
+            _verify_password(_get_dummy_record(), password)
+            return 'locked', record, None
+        
+        # ユーザー名とパスワードの検証
+        # 未登録のユーザーでも同じ計算量で検証し、ユーザーの存在を応答時間から推測させない
+        if record is None:
+            _verify_password(_get_dummy_record(), password)
+            return 'failed', None, None
+        if not _verify_password(record, password):
+            return 'failed', record, None
+        
+        if isinstance(record, str) or record.get('n') != _SCRYPT_N:
+            # 旧形式（平文または以前のパラメータ）のパスワードを現在の形式で再ハッシュ
+            return 'ok', record, _hash_password(password)
+        return 'ok', record, None
+
+    def _show_message(self, icon, title: str, text: str):
+        """
+        メッセージダイアログを表示
+
+        Args:
+            icon (QMessageBox.Icon): 表示するアイコン
+            title (str): ダイアログのタイトル
+            text (str): 表示するメッセージ
+
+        Note:
+            - ダイアログは初回のみ生成し、以降は同じインスタンスを再利用します
+            - 再利用するダイアログが表示中の場合（表示中に書き込みの失敗が通知された場合など）は、
+              表示中のメッセージを上書きしないよう、別のダイアログを生成して表示します
+        """
+        if self._msgbox is None:
+            self._msgbox = QMessageBox(self)
+        msgbox = self._msgbox
+        if msgbox.isVisible():
+            msgbox = QMessageBox(self)
+        msgbox.setIcon(icon)
+        msgbox.setWindowTitle(title)
+        msgbox.setText(text)
+        msgbox.exec()
+
+    def _warn(self, message: str):
+        """
+        エラーの警告ダイアログを表示
+
+        Args:
+            message (str): 表示するメッセージ
+        """
+        self._show_message(QMessageBox.Icon.Warning, "エラー", message)
+
+    def _on_login_checked(self, result):
+        """
+        パスワードの検証完了時の処理
+
+        検証に成功した場合はメインウィンドウを表示します。
+
+        Args:
+            result (tuple): _check_login の戻り値（検証結果, ユーザー情報, 再ハッシュしたユーザー情報）
+
+        Note:
+            - パスワードを間違えるとアカウントが一時的にロックされ、
+              ロック時間は失敗回数に応じて指数的に延長されます
+            - ロック中の試行も、パスワードの誤りと同じメッセージで応答します
+            - ロック中の試行は正しいパスワードの場合もあるため、ログイン試行回数には数えません
+        """
+        username = self._pending_login
+        self._pending_login = None
+        self.login_button.setEnabled(True)
+        self.register_button.setEnabled(True)
+        
+        status, record, new_record = result
+        
+        # ロック中も失敗と同じメッセージとし、アカウントの存在を推測させない
+        # （待機を促す文言は全ての失敗に表示する）
+        if status in ('failed', 'locked'):
+            if status == 'failed':
+                self.login_attempts += 1
+                
+                # 失敗回数に応じてアカウントをロック
+                if isinstance(record, dict):
+                    record['fails'] = record.get('fails', 0) + 1
+                    record['locked_until'] = time.time() + min(
+                        _LOCKOUT_BASE_SECONDS * 2 ** record['fails'], _LOCKOUT_MAX_SECONDS)
+                    self.save_user(username, record)
+            
+            self._warn(
+                "ユーザー名またはパスワードが正しくありません。\n"
+                "しばらく待ってから再試行してください。\n"
+                f"残り試行回数: {self.max_attempts - self.login_attempts}"
             )
             return
         
-        # ログイン成功
+        if new_record is not None:
+            # 旧形式のパスワードを再ハッシュしたユーザー情報を保存
+            self.save_user(username, new_record)
+        elif record.get('fails'):
+            # 失敗回数とロックをリセット
+            record['fails'] = 0
+            record['locked_until'] = 0
+            self.save_user(username, record)
+        
+        # ログイン成功（メインウィンドウとboto3の読み込みはログイン成功時まで遅延）
+        from .main_window import MainWindow
         self.main_window = MainWindow(username)
         self.main_window.show()
         self.close()
@@ -476,10 +977,18 @@ class LoginWindow(QMainWindow):
 
         Returns:
             bool: 認証情報が設定されている場合はTrue、それ以外はFalse
+
+        Note:
+            一度設定済みと判定された後は、認証情報の読み込みを省略します。
         """
+        if self._aws_creds_ok:
+            return True
+        
         access_key = self.credentials_manager.get_access_key()
         secret_key = self.credentials_manager.get_secret_key()
-        return bool(access_key and secret_key)
+        if access_key and secret_key:
+            self._aws_creds_ok = True
+        return self._aws_creds_ok
 
     def show_aws_credentials_dialog(self):
         """
@@ -492,76 +1001,136 @@ class LoginWindow(QMainWindow):
             - キャンセルした場合はFalseを返します
             - 認証情報が不完全な場合は再度ダイアログを表示します
         """
-        dialog = AWSCredentialsDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
+        # ダイアログは初回のみ生成し、以降は入力をクリアして再利用
+        if self._aws_dialog is None:
+            self._aws_dialog = AWSCredentialsDialog(self)
+        dialog = self._aws_dialog
+        dialog.access_key_input.clear()
+        dialog.secret_key_input.clear()
+        
+        while True:
+            if dialog.exec() != QDialog.DialogCode.Accepted:
+                return False
+            
             credentials = dialog.get_credentials()
             if not credentials['access_key'] or not credentials['secret_key']:
-                QMessageBox.warning(self, "エラー", "AWS認証情報を入力してください。")
-                return self.show_aws_credentials_dialog()
+                self._warn("AWS認証情報を入力してください。")
+                continue
             
             try:
                 self.credentials_manager.save_credentials(credentials)
                 return True
             except Exception as e:
-                QMessageBox.critical(self, "エラー", f"AWS認証情報の保存に失敗しました: {e}")
+                self._aws_creds_ok = False
+                self._show_message(QMessageBox.Icon.Critical, "エラー", f"AWS認証情報の保存に失敗しました: {e}")
                 return False
-        return False
 
     def show_register_dialog(self):
         """
         新規ユーザー登録ダイアログを表示
 
         新規ユーザーの登録処理を行います。
-        登録が成功した場合、AWS認証情報も同時に保存されます。
+        入力完了後、ユーザー情報の読み込みとパスワードのハッシュ化をワーカースレッドで開始し、
+        登録は完了後に _on_registration_prepared で行われます。
         """
+        if self._pending_registration is not None:
+            return
+        
         dialog = RegisterDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            data = dialog.get_registration_data()
+            self._pending_registration = data = dialog.get_registration_data()
+            self._start_user_task(self._on_registration_prepared, self._prepare_registration,
+                                  data['username'], data['password'])
+
+    def _prepare_registration(self, username: str, password: str):
+        """
+        登録するユーザー情報を作成（ワーカースレッドで実行）
+
+        Args:
+            username (str): ユーザー名
+            password (str): パスワード
+
+        Returns:
+            dict | None: パスワードハッシュのレコード。ユーザー名が既に使用されている場合はNone
+
+        Note:
+            scryptの計算はGUIスレッドを止めないよう、このワーカースレッドで行います。
+        """
+        if self.load_user(username) is not None:
+            return None
+        return _hash_password(password)
+
+    def _on_registration_prepared(self, record):
+        """
+        登録するユーザー情報の作成完了時に新規ユーザーを登録
+
+        登録が成功した場合、AWS認証情報も同時に保存されます。
+
+        Args:
+            record (dict | None): 登録するユーザー情報（ユーザー名が既に使用されている場合はNone）
+        """
+        data = self._pending_registration
+        self._pending_registration = None
+        self.login_button.setEnabled(True)
+        self.register_button.setEnabled(True)
+        
+        try:
+            # ユーザーの存在チェック
+            if record is None:
+                self._warn("このユーザー名は既に使用されています。")
+                return
             
+            # AWS認証情報の保存
+            credentials = {
+                'access_key': data['aws_access_key'],
+                'secret_key': data['aws_secret_key'],
+                'username': data['username']
+            }
             try:
-                # ユーザーの存在チェック
-                users = self.load_users()
-                if data['username'] in users:
-                    QMessageBox.warning(self, "エラー", "このユーザー名は既に使用されています。")
-                    return
-                
-                # AWS認証情報の保存
-                credentials_manager = CredentialsManager()
-                credentials = {
-                    'access_key': data['aws_access_key'],
-                    'secret_key': data['aws_secret_key'],
-                    'username': data['username']
-                }
-                try:
-                    credentials_manager.save_credentials(credentials)
-                except Exception as e:
-                    QMessageBox.warning(self, "エラー", "AWS認証情報の保存に失敗しました。")
-                    print(f"AWS認証情報保存エラー: {str(e)}")
-                    return
-                
-                # ユーザー情報の保存
-                users[data['username']] = data['password']
-                self.save_users(users)
-                
-                # 完了通知
-                QMessageBox.information(
-                    self,
-                    "登録完了",
-                    f"ユーザー '{data['username']}' の登録が完了しました。\n"
-                    "このアカウントでログインできます。"
-                )
-                
-                # 入力フィールドをクリア
-                self.username_input.clear()
-                self.password_input.clear()
-                
+                self.credentials_manager.save_credentials(credentials)
             except Exception as e:
-                QMessageBox.critical(
-                    self,
-                    "エラー",
-                    f"アカウント作成中にエラーが発生しました。\n"
-                    f"エラー内容: {str(e)}"
-                )
+                self._warn("AWS認証情報の保存に失敗しました。")
+                print(f"AWS認証情報保存エラー: {str(e)}")
+                return
+            
+            # ユーザー情報の保存
+            self.save_user(data['username'], record)
+            
+            # 完了通知
+            self._show_message(
+                QMessageBox.Icon.Information,
+                "登録完了",
+                f"ユーザー '{data['username']}' の登録が完了しました。\n"
+                "このアカウントでログインできます。"
+            )
+            
+            # 入力フィールドをクリア
+            self.username_input.clear()
+            self.password_input.clear()
+            
+        except Exception as e:
+            self._show_message(
+                QMessageBox.Icon.Critical,
+                "エラー",
+                f"アカウント作成中にエラーが発生しました。\n"
+                f"エラー内容: {str(e)}"
+            )
+
+    def closeEvent(self, event):
+        """
+        ウィンドウを閉じる際の処理
+
+        書き込み待ちのユーザー情報がある場合は、終了前に書き込みを完了させます。
+
+        Args:
+            event (QCloseEvent): クローズイベント
+        """
+        QThreadPool.globalInstance().waitForDone()
+        if self._pending_users:
+            self._save_timer.stop()
+            self._write_users(self._pending_users)
+            self._pending_users.clear()
+        super().closeEvent(event)
 
     def on_return_pressed(self):
         """
@@ -570,16 +1139,17 @@ class LoginWindow(QMainWindow):
         パスワード入力欄でEnterキーが押された場合、ログイン処理を実行します。
         """
         # ユーザー名とパスワードが両方入力されている場合のみログイン実行
-        if self.username_input.text() and self.password_input.text():
-            self.login()
+        username = self.username_input.text()
+        password = self.password_input.text()
+        if username and password:
+            self.login(username, password)
 
     def toggle_password_visibility(self):
         """
         パスワードの表示/非表示を切り替え
 
-        パスワード入力欄のエコーモードを切り替えます。
+        パスワード入力欄のエコーモードと切り替えボタンの表示を切り替えます。
         """
-        if self.password_input.echoMode() == QLineEdit.EchoMode.Password:
-            self.password_input.setEchoMode(QLineEdit.EchoMode.Normal)
-        else:
-            self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
\ No newline at end of file
+        show = self.password_input.echoMode() == _ECHO_PWD
+        self.password_input.setEchoMode(_ECHO_NORMAL if show else _ECHO_PWD)
+        self.show_password_button.setText('隠す' if show else '表示')
\ No newline at end of file
@@ -15,17 +15,316 @@
 """
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QPushButton, QTableWidget, QTableWidgetItem,
+                           QPushButton, QTableView,
                            QMessageBox, QMenu, QDialog, QLabel, QLineEdit,
-                           QTextEdit, QHeaderView, QApplication)
-from PyQt6.QtCore import Qt, QTimer, QEvent
-from PyQt6.QtGui import QDesktopServices
-from PyQt6.QtCore import QUrl
-import pyperclip
+                           QTextEdit, QHeaderView, QApplication, QStyledItemDelegate,
+                           QAbstractItemView)
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QDesktopServices, QPalette, QRegularExpressionValidator
+from PyQt6.QtCore import QUrl, QRegularExpression
 from ..utils.aws_manager import AWSManager
+from .worker import Task
 import configparser
+import hashlib
+import re
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+# アプリ名に使用できる文字（英数字、アンダースコア、ドット、ハイフン）
+# 入力欄のバリデーター（Qt）と保存時の検証（Python）で同じパターンを使用する
+_APP_NAME_PATTERN = r'[\w.\-]*'
+_APP_NAME_RE = re.compile(rf'\A{_APP_NAME_PATTERN}\Z')
+
+# パスワードのコピー後にクリップボードをクリアするまでの時間（ミリ秒）
+_CLIPBOARD_CLEAR_MS = 30_000
+
+# モデルで頻繁に参照する列挙値（描画のたびの属性参照を避ける）
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_STATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+_CHECK_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+_CELL_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+# パスワード入力欄のエコーモード
+_ECHO_PWD = QLineEdit.EchoMode.Password
+_ECHO_NORMAL = QLineEdit.EchoMode.Normal
+
+# パスワード列のマスク表示（全行で同じ文字列オブジェクトを返す）
+_MASK = '*' * 8
+
+# パスワード一覧テーブルで一度に表示に追加する行数
+_FETCH_BATCH_SIZE = 100
+
+# 設定ファイルのパス
+_CONFIG_PATH = Path.home() / '.password_manager' / 'config.ini'
+
+def _is_link(url: str) -> bool:
+    """
+    URLがブラウザで開けるリンクかどうかを判定
+
+    Args:
+        url (str): 判定するURL
+
+    Returns:
+        bool: http:// または https:// で始まる場合はTrue
+    """
+    return url.startswith(('http://', 'https://'))
+
+class _LinkDelegate(QStyledItemDelegate):
+    """
+    URL列の描画用デリゲート
+
+    リンクとして開けるURLを、リンク色と下線で描画します。
+    セルごとにウィジェットを配置せず、描画時に書式を設定します。
+    """
+
+    def initStyleOption(self, option, index):
+        """
+        描画オプションの初期化
+
+        Args:
+            option (QStyleOptionViewItem): 描画オプション
+            index (QModelIndex): 描画するセルのインデックス
+        """
+        super().initStyleOption(option, index)
+        if _is_link(option.text):
+            option.font.setUnderline(True)
+            option.palette.setBrush(QPalette.ColorRole.Text, option.palette.link())
+
+class PasswordTableModel(QAbstractTableModel):
+    """
+    パスワード一覧テーブルのモデル
+
+    パスワード情報のリストをそのまま保持し、表示時に必要なセルの値のみを返します。
+    セルごとのアイテムオブジェクトは生成しません。
+    行はスクロールに応じて一定数ずつビューに追加します（canFetchMore/fetchMore）。
+
+    Signals:
+        checkedChanged: チェック状態が変更された場合に通知
+    """
+    checkedChanged = pyqtSignal()
+
+    # 列の見出し（チェックボックス、アプリ名、URL、ユーザー名、パスワード、メモ）
+    HEADERS = ("", "アプリ名", "URL", "ユーザー名", "パスワード", "メモ")
+    CHECK_COLUMN = 0
+    URL_COLUMN = 2
+    PASSWORD_COLUMN = 4
+
+    def __init__(self, parent=None):
+        """
+        モデルの初期化
+
+        Args:
+            parent (QObject): 親オブジェクト
+
+        Attributes:
+            _rows (list): 表示するパスワード情報のリスト
+            _loaded (int): ビューに追加済みの行数
+            _cells (list): ビューに追加済みの行の表示値（行ごとのタプル）
+            _checked (set): チェックされている行番号
+            _revealed (set): パスワードのマスクを解除している行番号
+        """
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0
+        self._cells = []
+        self._checked = set()
+        self._revealed = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        """行数を取得（ビューに追加済みの行数）"""
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        """列数を取得"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """ビューに追加していない行が残っているかを判定"""
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        ビューに次の行をまとめて追加
+
+        Note:
+            ビューのスクロールが末尾に近づいた時に呼び出されます。
+        """
+        if parent.isValid():
+            return
+        count = min(_FETCH_BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self._build_cells()
+        self.endInsertRows()
+
+    def _build_cells(self):
+        """
+        ビューに追加した行の表示値を作成
+
+        Note:
+            描画のたびに辞書を参照しないよう、行ごとの表示値をタプルにまとめておきます。
+            パスワード列はマスク表示の値とし、マスクの解除時のみ data で実際の値を返します。
+        """
+        self._cells.extend(
+            (None, p.get('app_name', ''), p.get('url', ''), p.get('username', ''), _MASK, p.get('memo', ''))
+            for p in self._rows[len(self._cells):self._loaded]
+        )
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        """
+        セルの値を取得
+
+        Args:
+            index (QModelIndex): セルのインデックス
+            role (Qt.ItemDataRole): 取得する値の種類
+
+        Returns:
+            object: セルの値（該当しない場合はNone）
+        """
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        if role == _DISPLAY_ROLE:
+            # マスクを解除している行のみ実際のパスワードを表示
+            if column == self.PASSWORD_COLUMN and row in self._revealed:
+                return self._rows[row].get('password', '')
+            return self._cells[row][column]
+
+        if role == _CHECK_STATE_ROLE and column == self.CHECK_COLUMN:
+            return _CHECKED if row in self._checked else _UNCHECKED
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        """
+        チェック状態を設定
+
+        Args:
+            index (QModelIndex): セルのインデックス
+            value (Qt.CheckState | int): チェック状態
+            role (Qt.ItemDataRole): 設定する値の種類
+
+        Returns:
+            bool: 設定した場合はTrue
+        """
+        if (not index.isValid() or index.column() != self.CHECK_COLUMN
+                or role != _CHECK_STATE_ROLE):
+            return False
+
+        if Qt.CheckState(value) == _CHECKED:
+            self._checked.add(index.row())
+        else:
+            self._checked.discard(index.row())
+        self.dataChanged.emit(index, index, [role])
+        self.checkedChanged.emit()
+        return True
+
+    def flags(self, index):
+        """
+        セルのフラグを取得
+
+        Note:
+            チェックボックス列のみチェック可能とし、全ての列を編集不可とします。
+        """
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == self.CHECK_COLUMN:
+            return _CHECK_FLAGS
+        return _CELL_FLAGS
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        """列の見出しを取得"""
+        if orientation == Qt.Orientation.Horizontal and role == _DISPLAY_ROLE:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_passwords(self, passwords):
+        """
+        表示するパスワード情報を設定
+
+        Args:
+            passwords (list): パスワード情報のリスト
+
+        Note:
+            チェック状態とマスクの解除はクリアされます。
+            最初の行のみビューに追加し、残りはスクロールに応じて fetchMore で追加します。
+        """
+        self.beginResetModel()
+        self._rows = passwords
+        self._loaded = min(_FETCH_BATCH_SIZE, len(passwords))
+        self._cells = []
+        self._build_cells()
+        self._checked.clear()
+        self._revealed.clear()
+        self.endResetModel()
+
+    def password_at(self, row):
+        """
+        行のパスワード情報を取得
+
+        Args:
+            row (int): 行番号
+
+        Returns:
+            dict: パスワード情報
+        """
+        return self._rows[row]
+
+    def checked_rows(self):
+        """
+        チェックされている行番号を取得
+
+        Returns:
+            list: チェックされている行番号のリスト（昇順）
+        """
+        return sorted(self._checked)
+
+    def checked_count(self):
+        """チェックされている行の数を取得"""
+        return len(self._checked)
+
+    def toggle_revealed(self, row):
+        """
+        パスワードのマスク表示を切り替え
+
+        Args:
+            row (int): 行番号
+        """
+        if row in self._revealed:
+            self._revealed.discard(row)
+        else:
+            self._revealed.add(row)
+        index = self.index(row, self.PASSWORD_COLUMN)
+        self.dataChanged.emit(index, index, [_DISPLAY_ROLE])
+
+@lru_cache(maxsize=1)
+def _read_config(mtime_ns):
+    """
+    設定ファイルを読み込む
+
+    Args:
+        mtime_ns (int | None): 設定ファイルの更新時刻（ファイルが存在しない場合はNone）
+
+    Returns:
+        dict: 使用する設定値
+            {'session_timeout': int}
+
+    Note:
+        更新時刻をキャッシュのキーとするため、ファイルが変更されない限り再読み込みしません。
+    """
+    config = configparser.ConfigParser()
+    config.read(_CONFIG_PATH)
+    
+    return {
+        # セッションタイムアウトの設定（デフォルト: 30分）
+        'session_timeout': config.getint('App', 'session_timeout', fallback=30),
+    }
 
 class PasswordDialog(QDialog):
     def __init__(self, parent=None, password_data=None):
@@ -44,7 +343,6 @@ class PasswordDialog(QDialog):
             memo_input (QTextEdit): メモ入力フィールド
         """
         super().__init__(parent)
-        self.setWindowTitle("パスワード情報" if password_data else "新規パスワード")
         self.setFixedSize(400, 500)
         
         layout = QVBoxLayout()
@@ -52,7 +350,13 @@ class PasswordDialog(QDialog):
         # アプリ名
         self.app_name_input = QLineEdit()
         self.app_name_input.setPlaceholderText("アプリ名")
-        self.app_name_input.textChanged.connect(self.validate_app_name)
+        # 使用できない文字は入力時にQt側で拒否する（キー入力ごとのPython呼び出しを避ける）
+        # （Pythonのreと同様に \w が日本語などの文字に一致するよう、Unicodeプロパティを有効にする）
+        self.app_name_input.setValidator(QRegularExpressionValidator(
+            QRegularExpression(_APP_NAME_PATTERN,
+                               QRegularExpression.PatternOption.UseUnicodePropertiesOption),
+            self.app_name_input))
+        self.app_name_input.editingFinished.connect(self.validate_app_name)
         layout.addWidget(QLabel("アプリ名:"))
         layout.addWidget(self.app_name_input)
         
@@ -71,7 +375,7 @@ class PasswordDialog(QDialog):
         # パスワード
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("パスワード")
-        self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
+        self.password_input.setEchoMode(_ECHO_PWD)
         layout.addWidget(QLabel("パスワード:"))
         
         password_layout = QHBoxLayout()
@@ -102,13 +406,32 @@ class PasswordDialog(QDialog):
         
         self.setLayout(layout)
         
+        self.reset(password_data)
+
+    def reset(self, password_data=None):
+        """
+        入力内容を初期化
+
+        Args:
+            password_data (dict, optional): 編集時の既存パスワード情報。
+                指定がない場合は全ての入力欄を空にします。
+
+        Note:
+            - ダイアログを再利用する際に、表示前に呼び出します
+            - 編集時はアプリ名（パラメータ名）を変更できないよう、アプリ名の入力欄を読み取り専用にします
+        """
+        password_data = password_data or {}
+        self.setWindowTitle("パスワード情報" if password_data else "新規パスワード")
+        
         # 既存のデータがある場合は入力欄に設定
-        if password_data:
-            self.app_name_input.setText(password_data.get('app_name', ''))
-            self.url_input.setText(password_data.get('url', ''))
-            self.username_input.setText(password_data.get('username', ''))
-            self.password_input.setText(password_data.get('password', ''))
-            self.memo_input.setText(password_data.get('memo', ''))
+        self.app_name_input.setText(password_data.get('app_name', ''))
+        self.app_name_input.setReadOnly(bool(password_data))
+        self.url_input.setText(password_data.get('url', ''))
+        self.username_input.setText(password_data.get('username', ''))
+        self.password_input.setText(password_data.get('password', ''))
+        self.password_input.setEchoMode(_ECHO_PWD)
+        self.memo_input.setText(password_data.get('memo', ''))
+        self.validate_app_name()
 
     def toggle_password_visibility(self):
         """
@@ -116,10 +439,10 @@ class PasswordDialog(QDialog):
 
         パスワード入力欄のエコーモードを切り替えます。
         """
-        if self.password_input.echoMode() == QLineEdit.EchoMode.Password:
-            self.password_input.setEchoMode(QLineEdit.EchoMode.Normal)
+        if self.password_input.echoMode() == _ECHO_PWD:
+            self.password_input.setEchoMode(_ECHO_NORMAL)
         else:
-            self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
+            self.password_input.setEchoMode(_ECHO_PWD)
 
     def validate_app_name(self):
         """
@@ -127,11 +450,16 @@ class PasswordDialog(QDialog):
 
         アプリ名に使用できる文字は英数字とアンダースコア、ハイフン、ドットのみです。
 
+        Note:
+            - 入力中の文字はバリデーターで制限されるため、このメソッドは入力確定時と
+              保存時（既存データに使用できない文字が含まれる場合の検出）にのみ呼び出されます
+            - 編集時（読み取り専用）のアプリ名は既存のパラメータ名のため、検証せずに有効とします
+
         Returns:
             bool: バリデーションに成功した場合はTrue、それ以外はFalse
         """
         text = self.app_name_input.text()
-        valid = all(c.isalnum() or c in '_.-' for c in text)
+        valid = self.app_name_input.isReadOnly() or _APP_NAME_RE.match(text) is not None
         if not valid and text:
             self.app_name_input.setStyleSheet("background-color: #ffebee;")
         else:
@@ -174,6 +502,10 @@ class MainWindow(QMainWindow):
             username (str): ログインユーザー名
             aws_manager (AWSManager): AWS操作マネージャー
             passwords (list): パスワード情報のリスト
+            _passwords_by_app (dict): アプリ名をキーとしたパスワード情報（表示中の一覧から生成）
+            model (PasswordTableModel): パスワード一覧テーブルのモデル
+            _clipboard_digest (bytes): クリップボードにコピーしたパスワードのSHA-256ダイジェスト
+            _clipboard_timer (QTimer): クリップボードのクリア用タイマー
             activity_timer (QTimer): アクティビティ監視タイマー
             last_activity (datetime): 最後のアクティビティ時刻
             session_timeout (int): セッションタイムアウト時間（分）
@@ -189,50 +521,165 @@ class MainWindow(QMainWindow):
         # 設定の読み込み
         self.load_config()
         
-        # AWSマネージャーの初期化とパスワード一覧の取得
-        self.aws_manager = AWSManager()
-        self.passwords = self.aws_manager.get_passwords(self.username)
+        # AWSマネージャーとパスワード一覧はウィンドウ表示後に初期化（_initial_load）
+        self.aws_manager = None
+        self.passwords = []
+        self._passwords_by_app = {}
+        
+        # AWSとの通信中の場合はTrue（通信中はツールバーを無効化）
+        self._aws_busy = False
+        
+        # コピーしたパスワードのクリア用タイマー（パスワード本体は保持せず、ダイジェストで照合する）
+        self._clipboard_digest = None
+        self._clipboard_timer = QTimer(self)
+        self._clipboard_timer.setSingleShot(True)
+        self._clipboard_timer.timeout.connect(self._clear_clipboard)
+        
+        # 再利用するダイアログ（初回表示時に生成）
+        self._password_dialog = None
+        self._settings_dialog = None
         
         # UIの初期化
         self.init_ui()
         
-        # パスワード一覧の初期表示（既に取得済みのデータを使用）
-        self.update_table_display()
-        
         # アクティビティタイマーの設定
+        # （タイムアウトまでの残り時間で再設定する単発タイマーとし、不要な定期起動を避ける）
+        self.last_activity = datetime.now()
         self.activity_timer = QTimer(self)
+        self.activity_timer.setSingleShot(True)
         self.activity_timer.timeout.connect(self.check_activity)
-        self.activity_timer.start(60000)  # 1分ごとにチェック
-        self.last_activity = datetime.now()
+        self.activity_timer.start(self.session_timeout * 60 * 1000)
         
         # ウィンドウを中央に配置
         self.center_window()
+        
+        # パスワード一覧の取得は、ウィンドウが表示されてから行う
+        QTimer.singleShot(0, self._initial_load)
 
-    def check_activity(self):
+    def _initial_load(self):
         """
-        ユーザーのアクティビティをチェックし、必要に応じて自動ログアウト
+        パスワード一覧の初回読み込み
 
-        一定時間操作がない場合、セッションを終了してアプリケーションを終了します。
+        AWSマネージャーを初期化してパスワード一覧を取得し、テーブルに表示します。
+
+        Note:
+            AWSとの通信を待たずにウィンドウを表示するため、
+            コンストラクタからイベントループ経由で呼び出されます。
+            初期化と取得はワーカースレッドで行われます。
         """
-        if (datetime.now() - self.last_activity).total_seconds() > self.session_timeout * 60:
-            QMessageBox.warning(self, "セッションタイムアウト", 
-                              "一定時間操作がなかったため、セッションを終了します。")
-            self.close()
+        self._start_aws_task(self._on_initial_loaded, self._create_aws_manager)
 
-    def eventFilter(self, obj, event):
+    def _create_aws_manager(self):
         """
-        イベントフィルター（ユーザーのアクティビティを監視）
+        AWSマネージャーを初期化してパスワード一覧を取得（ワーカースレッドで実行）
+
+        Returns:
+            tuple: (AWSManager, パスワード情報のリスト)
+        """
+        aws_manager = AWSManager()
+        return aws_manager, aws_manager.get_passwords(self.username)
+
+    def _on_initial_loaded(self, result):
+        """
+        パスワード一覧の初回読み込み完了時の処理
 
         Args:
-            obj (QObject): イベントを受け取ったオブジェクト
-            event (QEvent): 発生したイベント
+            result (tuple): (AWSManager, パスワード情報のリスト)
+        """
+        self.aws_manager, self.passwords = result
+        # 通信完了時点ではAWSマネージャーが未設定のため、追加ボタンはここで有効化する
+        self.add_button.setEnabled(not self._aws_busy)
+        self.update_table_display()
+
+    def _start_aws_task(self, on_finished, func, *args):
+        """
+        AWSとの通信をワーカースレッドで開始
+
+        Args:
+            on_finished (Callable[[object], None]): 完了時にGUIスレッドで呼び出す関数
+            func (Callable): ワーカースレッドで実行する関数
+            *args: funcに渡す引数
 
         Returns:
-            bool: イベントを処理した場合はTrue、それ以外はFalse
+            bool: 開始した場合はTrue、他の通信中のため開始しなかった場合はFalse
+
+        Note:
+            通信中はツールバーのボタンを無効化し、同時に複数の通信を行わないようにします。
+        """
+        if self._aws_busy:
+            return False
+        
+        self._set_aws_busy(True)
+        task = Task(func, *args)
+        task.signals.finished.connect(lambda result: self._on_aws_task_finished(on_finished, result))
+        task.signals.failed.connect(self._on_aws_task_failed)
+        QThreadPool.globalInstance().start(task)
+        return True
+
+    def _on_aws_task_finished(self, on_finished, result):
         """
-        if event.type() in [QEvent.Type.MouseButtonPress, QEvent.Type.KeyPress]:
-            self.last_activity = datetime.now()
-        return super().eventFilter(obj, event)
+        AWSとの通信完了時の処理
+
+        Args:
+            on_finished (Callable[[object], None]): 完了時に呼び出す関数
+            result (object): ワーカースレッドでの処理結果
+        """
+        self._set_aws_busy(False)
+        on_finished(result)
+
+    def _on_aws_task_failed(self):
+        """AWSとの通信に失敗した場合の処理"""
+        self._set_aws_busy(False)
+        QMessageBox.warning(self, "エラー", "AWSとの通信に失敗しました。")
+
+    def _set_aws_busy(self, busy: bool):
+        """
+        AWSとの通信中の状態を設定
+
+        Args:
+            busy (bool): 通信中の場合はTrue
+
+        Note:
+            通信中はツールバーのボタンを全て無効化し、
+            通信完了後は選択状態に応じて有効/無効を戻します。
+            AWSマネージャーの初期化に失敗している間は、追加ボタンを無効のままにします
+            （更新ボタンで初期化を再試行できます）。
+        """
+        self._aws_busy = busy
+        self.add_button.setEnabled(not busy and self.aws_manager is not None)
+        self.refresh_button.setEnabled(not busy)
+        if busy:
+            for button in (self.edit_button, self.delete_button, self.copy_url_button,
+                           self.copy_username_button, self.copy_password_button):
+                button.setEnabled(False)
+        else:
+            self.update_button_states()
+
+    def check_activity(self):
+        """
+        ユーザーのアクティビティをチェックし、必要に応じて自動ログアウト
+
+        一定時間操作がない場合、セッションを終了してアプリケーションを終了します。
+        操作があった場合は、最後の操作からタイムアウトまでの残り時間でタイマーを再設定します。
+        """
+        remaining = self.session_timeout * 60 - (datetime.now() - self.last_activity).total_seconds()
+        if remaining > 0:
+            self.activity_timer.start(int(remaining * 1000) + 1)
+            return
+        
+        QMessageBox.warning(self, "セッションタイムアウト", 
+                          "一定時間操作がなかったため、セッションを終了します。")
+        self.close()
+
+    def record_activity(self):
+        """
+        ユーザーのアクティビティを記録
+
+        Note:
+            全イベントを監視するイベントフィルターの代わりに、
+            ユーザー操作を処理する各スロットから呼び出されます。
+        """
+        self.last_activity = datetime.now()
 
     def load_config(self):
         """
@@ -242,12 +689,16 @@ class MainWindow(QMainWindow):
         - セッションタイムアウト時間
         - 最大ログイン試行回数
         - パスワードキャッシュ期間
+
+        Note:
+            設定ファイルが前回の読み込みから変更されていない場合は、解析済みの値を再利用します。
         """
-        config = configparser.ConfigParser()
-        config.read(Path.home() / '.password_manager' / 'config.ini')
+        try:
+            mtime_ns = _CONFIG_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
         
-        # セッションタイムアウトの設定（デフォルト: 30分）
-        self.session_timeout = config.getint('App', 'session_timeout', fallback=30)
+        self.session_timeout = _read_config(mtime_ns)['session_timeout']
 
     def init_ui(self):
         """
@@ -256,7 +707,6 @@ class MainWindow(QMainWindow):
         以下のUIコンポーネントを設定します:
         - ツールバー（コピー、追加、編集、削除ボタン）
         - パスワード一覧テーブル
-        - イベントフィルター
         """
         # メインウィジェットとレイアウトの設定
         main_widget = QWidget()
@@ -264,10 +714,6 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
         main_widget.setLayout(layout)
         
-        # イベントフィルターの設定
-        self.installEventFilter(self)
-        main_widget.installEventFilter(self)
-        
         # ツールバーの設定
         toolbar_layout = QHBoxLayout()
         
@@ -291,9 +737,10 @@ class MainWindow(QMainWindow):
         toolbar_layout.addStretch()
         
         # 右側の操作ボタン
-        add_button = QPushButton("追加")
-        add_button.clicked.connect(self.add_password)
-        toolbar_layout.addWidget(add_button)
+        self.add_button = QPushButton("追加")
+        self.add_button.clicked.connect(self.add_password)
+        self.add_button.setEnabled(False)  # AWSマネージャーの初期化後に有効化
+        toolbar_layout.addWidget(self.add_button)
         
         self.edit_button = QPushButton("編集")
         self.edit_button.clicked.connect(self.edit_selected_passwords)
@@ -306,92 +753,96 @@ class MainWindow(QMainWindow):
         toolbar_layout.addWidget(self.delete_button)
         
         # 更新ボタン（緑色）
-        refresh_button = QPushButton("更新")
-        refresh_button.clicked.connect(self.refresh_table)
-        refresh_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-        """)
-        toolbar_layout.addWidget(refresh_button)
+        self.refresh_button = QPushButton("更新")
+        self.refresh_button.clicked.connect(self.refresh_table)
+        # スタイルはアプリケーション全体のスタイルシート（src/main.py）で設定
+        self.refresh_button.setObjectName('refreshButton')
+        toolbar_layout.addWidget(self.refresh_button)
         
         layout.addLayout(toolbar_layout)
         
-        # テーブルの設定
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)  # チェックボックス、アプリ名、URL、ユーザー名、パスワード、メモ
-        self.table.setHorizontalHeaderLabels([
-            "", "アプリ名", "URL", "ユーザー名", "パスワード", "メモ"
-        ])
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # アプリ名列を伸縮可能に
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # URL列を伸縮可能に
-        self.table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)  # メモ列を伸縮可能に
-        
-        # アイテム変更時のイベントを接続
-        self.table.itemChanged.connect(self.on_item_changed)
+        # テーブルの設定（表示する値はモデルがパスワード情報のリストから直接返す）
+        self.model = PasswordTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # アプリ名列を伸縮可能に
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)  # URL列を伸縮可能に
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)  # メモ列を伸縮可能に
+        self.table.setColumnWidth(0, 30)   # チェックボックス
+        self.table.setColumnWidth(3, 150)  # ユーザー名
+        self.table.setColumnWidth(4, 100)  # パスワード
+        # 行の高さを固定し、行ごとのサイズ計算を行わないようにする
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
+        # スクロールはピクセル単位とし、スクロールのたびに表示中の全行を描画し直さないようにする
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.table.setItemDelegateForColumn(PasswordTableModel.URL_COLUMN, _LinkDelegate(self.table))  # URL列をリンク表示
+        
+        # チェック状態の変更時のイベントを接続
+        self.model.checkedChanged.connect(self.on_checked_changed)
         # ダブルクリック時のイベントを接続
-        self.table.cellDoubleClicked.connect(self.on_cell_double_clicked)
+        self.table.doubleClicked.connect(self.on_cell_double_clicked)
+        # クリック時のイベントを接続（URL列のリンクを開く）
+        self.table.clicked.connect(self.on_cell_clicked)
         
         layout.addWidget(self.table)
 
-    def on_item_changed(self, item):
-        """テーブルアイテムの変更時のイベントハンドラ"""
-        if item.column() == 0:  # チェックボックス列の変更時のみ
-            self.update_button_states()
+    def on_checked_changed(self):
+        """チェック状態の変更時のイベントハンドラ"""
+        self.record_activity()
+        self.update_button_states()
 
-    def on_cell_double_clicked(self, row, column):
+    def on_cell_clicked(self, index):
+        """セルがクリックされたときの処理（URL列のリンクをブラウザで開く）"""
+        if index.column() == PasswordTableModel.URL_COLUMN:
+            url = self.model.password_at(index.row()).get('url', '')
+            if _is_link(url):
+                self.record_activity()
+                QDesktopServices.openUrl(QUrl(url))
+
+    def on_cell_double_clicked(self, index):
         """セルがダブルクリックされたときの処理"""
-        if column == 4:  # パスワード列
-            item = self.table.item(row, column)
-            if item:
-                app_name = self.table.item(row, 1).text()  # アプリ名を取得
-                passwords = self.aws_manager.get_passwords(self.username)
-                
-                # 実際のパスワードを取得
-                actual_password = None
-                for pwd in passwords:
-                    if pwd['app_name'] == app_name:
-                        actual_password = pwd['password']
-                        break
-                
-                if actual_password:
-                    if item.text() == '*' * 8:  # マスク表示中
-                        item.setText(actual_password)  # マスクを解除
-                    else:
-                        item.setText('*' * 8)  # マスクを設定
+        self.record_activity()
+        if index.column() == PasswordTableModel.PASSWORD_COLUMN:  # パスワード列
+            # パスワードが登録されている場合のみマスク表示を切り替え
+            if self.model.password_at(index.row()).get('password'):
+                self.model.toggle_revealed(index.row())
+
+    def get_checked_rows(self):
+        """
+        チェックされている行番号を取得
+
+        Returns:
+            list: チェックされている行番号のリスト（昇順）
+
+        Note:
+            チェック状態はモデルが保持しているため、テーブルは走査しません。
+        """
+        return self.model.checked_rows()
 
     def update_button_states(self):
         """
         ボタンの有効/無効状態を更新
 
         選択されているパスワードの数に応じて、各ボタンの有効/無効を切り替えます。
+        AWSとの通信中は全て無効のままにします。
         """
-        checked_rows = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)  # チェックボックス列
-            if item and item.checkState() == Qt.CheckState.Checked:
-                checked_rows.append(row)
+        if self._aws_busy:
+            return
+        
+        selected_count = self.get_selected_count()
         
         # 1つのみ選択時に有効にするボタン
-        is_single_selected = len(checked_rows) == 1
+        is_single_selected = selected_count == 1
         self.edit_button.setEnabled(is_single_selected)
         self.copy_url_button.setEnabled(is_single_selected)
         self.copy_username_button.setEnabled(is_single_selected)
         self.copy_password_button.setEnabled(is_single_selected)
         
         # 1つ以上選択時に有効にするボタン
-        self.delete_button.setEnabled(len(checked_rows) > 0)
+        self.delete_button.setEnabled(selected_count > 0)
 
     def get_selected_passwords(self):
         """
@@ -400,19 +851,7 @@ class MainWindow(QMainWindow):
         Returns:
             list: 選択されているパスワード情報のリスト
         """
-        selected = []
-        passwords = self.aws_manager.get_passwords(self.username)
-        
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)  # チェックボックス列
-            if item and item.checkState() == Qt.CheckState.Checked:
-                app_name = self.table.item(row, 1).text()
-                for password in passwords:
-                    if password['app_name'] == app_name:
-                        selected.append(password)
-                        break
-        
-        return selected
+        return [self.model.password_at(row) for row in self.get_checked_rows()]
 
     def copy_selected_field(self, field: str):
         """
@@ -425,35 +864,40 @@ class MainWindow(QMainWindow):
             - パスワードの場合、30秒後に自動的にクリップボードをクリアします
             - コピー成功時にステータスバーに通知を表示します
         """
-        checked_rows = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)  # チェックボックス列
-            if item and item.checkState() == Qt.CheckState.Checked:
-                checked_rows.append(row)
+        self.record_activity()
+        checked_rows = self.get_checked_rows()
         
         if len(checked_rows) != 1:
             QMessageBox.warning(self, "エラー", "1つの項目を選択してください。")
             return
         
-        row = checked_rows[0]
-        field_mapping = {
-            'url': 2,      # URL列のインデックス
-            'username': 3,  # ユーザー名列のインデックス
-            'password': 4,  # パスワード列のインデックス
-        }
-        
-        if field in field_mapping:
-            value = self.table.item(row, field_mapping[field]).text()
-            if field == 'password':
-                # パスワードの場合は、実際の値を取得
-                passwords = self.aws_manager.get_passwords(self.username)
-                app_name = self.table.item(row, 1).text()  # アプリ名列から取得
-                for pwd in passwords:
-                    if pwd['app_name'] == app_name:
-                        value = pwd['password']
-                        break
+        if field in ('url', 'username', 'password'):
+            # 表示中のセルではなくパスワード情報から取得（パスワードはマスクされていない値）
+            value = self.model.password_at(checked_rows[0]).get(field, '')
+            
+            QApplication.clipboard().setText(value)
             
-            pyperclip.copy(value)
+            if field == 'password':
+                # 一定時間後に一度だけクリア（定期的な監視は行わない）
+                # タイマーのコールバックに平文を保持させないよう、ダイジェストのみを記録する
+                self._clipboard_digest = hashlib.sha256(value.encode('utf-8')).digest()
+                self._clipboard_timer.start(_CLIPBOARD_CLEAR_MS)
+
+    def _clear_clipboard(self):
+        """
+        クリップボードにコピーしたパスワードをクリア
+
+        Note:
+            クリップボードがコピー後に別の内容に置き換えられている場合はクリアしません。
+        """
+        digest, self._clipboard_digest = self._clipboard_digest, None
+        if digest is None:
+            return
+        
+        self._clipboard_timer.stop()
+        clipboard = QApplication.clipboard()
+        if hashlib.sha256(clipboard.text().encode('utf-8')).digest() == digest:
+            clipboard.clear()
 
     def update_table_display(self):
         """
@@ -462,58 +906,23 @@ class MainWindow(QMainWindow):
         AWS上のパスワード情報を取得し、テーブルに表示します。
 
         Note:
-            - テーブルのヘッダーとカラム幅を自動調整します
+            - 列の見出しと幅は init_ui で一度だけ設定します
             - パスワードは非表示（*****）で表示されます
         """
         try:
-            # テーブルをクリア
-            self.table.setRowCount(0)
+            # アプリ名での参照用に表示中の一覧をまとめる
+            self._passwords_by_app = {p['app_name']: p for p in self.passwords}
             
             if not self.passwords:
                 if self.aws_manager.ssm is None:
                     # 認証情報が設定されていない場合
+                    self.model.set_passwords([])
                     self.show_credentials_warning()
                     return
             
-            # パスワード一覧を表示
-            for i, password in enumerate(self.passwords):
-                self.table.insertRow(i)
-                
-                # チェックボックス
-                checkbox_item = QTableWidgetItem()
-                checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                checkbox_item.setCheckState(Qt.CheckState.Unchecked)
-                self.table.setItem(i, 0, checkbox_item)
-                
-                # アプリ名
-                self.table.setItem(i, 1, QTableWidgetItem(password.get('app_name', '')))
-                
-                # URL（クリック可能なリンク）
-                url = password.get('url', '')
-                url_cell = QWidget()
-                url_layout = QHBoxLayout(url_cell)
-                url_layout.setContentsMargins(5, 0, 5, 0)
-                
-                if url and (url.startswith('http://') or url.startswith('https://')):
-                    url_label = QLabel(f'<a href="{url}">{url}</a>')
-                    url_label.setOpenExternalLinks(True)
-                    url_label.setTextFormat(Qt.TextFormat.RichText)
-                else:
-                    url_label = QLabel(url)
-                
-                url_layout.addWidget(url_label)
-                url_cell.setLayout(url_layout)
-                self.table.setCellWidget(i, 2, url_cell)
-                
-                # その他の情報
-                self.table.setItem(i, 3, QTableWidgetItem(password.get('username', '')))
-                self.table.setItem(i, 4, QTableWidgetItem('*' * 8))  # パスワードはマスク表示
-                self.table.setItem(i, 5, QTableWidgetItem(password.get('memo', '')))
-            
-            # 列幅の調整
-            self.table.setColumnWidth(0, 30)   # チェックボックス
-            self.table.setColumnWidth(3, 150)  # ユーザー名
-            self.table.setColumnWidth(4, 100)  # パスワード
+            # モデルの内容を置き換える（チェック状態とマスクの解除はクリアされる）
+            # セルの値はモデルが表示時に返すため、アイテムは生成しない
+            self.model.set_passwords(self.passwords)
             
             # ボタンの状態を更新
             self.update_button_states()
@@ -527,60 +936,58 @@ class MainWindow(QMainWindow):
         パスワード一覧を最新の状態に更新
 
         AWSから最新のパスワード情報を取得し、テーブルを更新します。
+
+        Note:
+            取得はワーカースレッドで行われ、完了後に _on_passwords_loaded でテーブルを更新します。
+            AWSマネージャーの初期化に失敗している場合は、初期化からやり直します。
         """
-        try:
-            # AWS認証情報の再設定（更新のため）
-            self.aws_manager = AWSManager()
-            
-            # パスワード一覧を取得
-            self.passwords = self.aws_manager.get_passwords(self.username)
-            
-            # テーブル表示を更新
-            self.update_table_display()
-            
-        except Exception as e:
-            print(f"テーブル更新エラー: {e}")
-            QMessageBox.warning(self, "エラー", "パスワード一覧の更新に失敗しました。")
+        self.record_activity()
+        if self.aws_manager is None:
+            self._initial_load()
+            return
+        self._start_aws_task(self._on_passwords_loaded, self._fetch_latest_passwords)
 
-    def on_selection_changed(self, item):
+    def _fetch_latest_passwords(self):
         """
-        テーブルの選択状態が変更された時の処理
+        最新のパスワード一覧を取得（ワーカースレッドで実行）
 
-        Args:
-            item (QTableWidgetItem): 選択されたアイテム
+        Returns:
+            list: パスワード情報のリスト
+        """
+        # AWS認証情報の再読み込み（変更がなければ既存のクライアントを使用）
+        self.aws_manager.reload_credentials()
+        
+        # キャッシュを使わずに最新のパスワード一覧を取得
+        self.aws_manager.invalidate_cache()
+        return self.aws_manager.get_passwords(self.username)
+
+    def _reload_passwords(self):
+        """
+        保存・削除後にパスワード一覧を再表示
 
         Note:
-            選択状態に応じてボタンの有効/無効を更新します。
+            保存・削除の結果はAWSマネージャーのキャッシュに反映されているため、
+            キャッシュが有効な間はAWSに問い合わせずに一覧を取得します。
+            最新の状態をAWSから取得する場合は refresh_table を使用します。
+        """
+        if self.aws_manager is None:
+            return
+        self._start_aws_task(self._on_passwords_loaded,
+                             self.aws_manager.get_passwords, self.username)
+
+    def _on_passwords_loaded(self, passwords):
         """
-        if item and item.column() == 0:  # チェックボックス列の変更のみ処理
-            selected_count = self.get_selected_count()
-            self.edit_button.setEnabled(selected_count == 1)  # 1つ選択時のみ編集可能
-            self.delete_button.setEnabled(selected_count > 0)  # 1つ以上選択時に削除可能
+        パスワード一覧の取得完了時の処理
+
+        Args:
+            passwords (list): 取得したパスワード情報のリスト
+        """
+        self.passwords = passwords
+        self.update_table_display()
 
     def get_selected_count(self):
         """選択されているアイテムの数を取得"""
-        count = 0
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                count += 1
-        return count
-
-    def get_selected_passwords(self):
-        """選択されているパスワード情報を取得"""
-        selected = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.checkState() == Qt.CheckState.Checked:
-                password_data = {
-                    'app_name': self.table.item(row, 1).text(),
-                    'url': self.table.item(row, 2).text(),
-                    'username': self.table.item(row, 3).text(),
-                    'password': self.aws_manager.get_passwords(self.username)[row]['password'],
-                    'memo': self.table.item(row, 5).text()
-                }
-                selected.append(password_data)
-        return selected
+        return self.model.checked_count()
 
     def edit_selected_passwords(self):
         """
@@ -588,6 +995,7 @@ class MainWindow(QMainWindow):
 
         選択されているパスワードの編集ダイアログを表示します。
         """
+        self.record_activity()
         selected = self.get_selected_passwords()
         if len(selected) == 1:
             self.edit_password(selected[0])
@@ -598,6 +1006,9 @@ class MainWindow(QMainWindow):
 
         確認ダイアログを表示し、承認された場合は選択されているパスワードを削除します。
         """
+        self.record_activity()
+        if self.aws_manager is None:
+            return
         selected = self.get_selected_passwords()
         if not selected:
             return
@@ -611,20 +1022,28 @@ class MainWindow(QMainWindow):
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
                                    
         if reply == QMessageBox.StandardButton.Yes:
-            success = True
-            for password in selected:
-                if not self.aws_manager.delete_password(self.username, password['app_name']):
-                    success = False
-                    break
-            
-            if success:
-                if len(selected) == 1:
-                    QMessageBox.information(self, "成功", f"パスワード '{selected[0]['app_name']}' を削除しました。")
-                else:
-                    QMessageBox.information(self, "成功", f"{len(selected)}件のパスワードを削除しました。")
-                self.refresh_table()  # 削除後に更新
+            app_names = [password['app_name'] for password in selected]
+            self._start_aws_task(
+                lambda success: self._on_passwords_deleted(success, app_names),
+                self.aws_manager.delete_passwords, self.username, app_names
+            )
+
+    def _on_passwords_deleted(self, success: bool, app_names: list):
+        """
+        パスワード情報の削除完了時の処理
+
+        Args:
+            success (bool): 削除に成功した場合はTrue
+            app_names (list): 削除したアプリ名のリスト
+        """
+        if success:
+            if len(app_names) == 1:
+                QMessageBox.information(self, "成功", f"パスワード '{app_names[0]}' を削除しました。")
             else:
-                QMessageBox.warning(self, "エラー", "パスワードの削除に失敗しました。")
+                QMessageBox.information(self, "成功", f"{len(app_names)}件のパスワードを削除しました。")
+            self._reload_passwords()  # 削除後に更新
+        else:
+            QMessageBox.warning(self, "エラー", "パスワードの削除に失敗しました。")
 
     def show_credentials_warning(self):
         """
@@ -647,6 +1066,34 @@ class MainWindow(QMainWindow):
         設定ダイアログを表示
 
         AWS認証情報の設定ダイアログを表示します。
+
+        Note:
+            ダイアログは初回のみ生成し、以降は現在の認証情報を設定し直して再利用します。
+        """
+        self.record_activity()
+        if self.aws_manager is None:
+            return
+        if self._settings_dialog is None:
+            self._settings_dialog = self._create_settings_dialog()
+        dialog, access_key_input, secret_key_input = self._settings_dialog
+        
+        credentials_manager = self.aws_manager.credentials_manager
+        access_key_input.setText(credentials_manager.get_access_key())
+        secret_key_input.setText(credentials_manager.get_secret_key())
+        
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.aws_manager.update_credentials(
+                access_key_input.text(),
+                secret_key_input.text()
+            )
+            self.refresh_table()
+
+    def _create_settings_dialog(self):
+        """
+        設定ダイアログを生成
+
+        Returns:
+            tuple: (ダイアログ, アクセスキー入力フィールド, シークレットキー入力フィールド)
         """
         dialog = QDialog(self)
         dialog.setWindowTitle('AWS設定')
@@ -657,15 +1104,13 @@ class MainWindow(QMainWindow):
         # アクセスキー
         access_key_label = QLabel('AWSアクセスキー:')
         access_key_input = QLineEdit()
-        access_key_input.setText(self.aws_manager.credentials_manager.get_access_key())
         layout.addWidget(access_key_label)
         layout.addWidget(access_key_input)
         
         # シークレットキー
         secret_key_label = QLabel('AWSシークレトキー:')
         secret_key_input = QLineEdit()
-        secret_key_input.setText(self.aws_manager.credentials_manager.get_secret_key())
-        secret_key_input.setEchoMode(QLineEdit.EchoMode.Password)
+        secret_key_input.setEchoMode(_ECHO_PWD)
         layout.addWidget(secret_key_label)
         layout.addWidget(secret_key_input)
         
@@ -674,15 +1119,7 @@ class MainWindow(QMainWindow):
         save_button = QPushButton('保存')
         cancel_button = QPushButton('キャンセル')
         
-        def save_credentials():
-            self.aws_manager.update_credentials(
-                access_key_input.text(),
-                secret_key_input.text()
-            )
-            dialog.accept()
-            self.refresh_table()
-        
-        save_button.clicked.connect(save_credentials)
+        save_button.clicked.connect(dialog.accept)
         cancel_button.clicked.connect(dialog.reject)
         
         button_layout.addWidget(save_button)
@@ -690,7 +1127,25 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog, access_key_input, secret_key_input
+
+    def _get_password_dialog(self, password_data=None):
+        """
+        パスワード情報入力ダイアログを取得
+
+        Args:
+            password_data (dict, optional): 編集時の既存パスワード情報
+
+        Returns:
+            PasswordDialog: 入力内容を初期化したダイアログ
+
+        Note:
+            ダイアログは初回のみ生成し、以降は入力内容を初期化して再利用します。
+        """
+        if self._password_dialog is None:
+            self._password_dialog = PasswordDialog(self)
+        self._password_dialog.reset(password_data)
+        return self._password_dialog
 
     def add_password(self):
         """
@@ -698,7 +1153,10 @@ class MainWindow(QMainWindow):
 
         パスワード情報入力ダイアログを表示し、入力された情報を保存します。
         """
-        dialog = PasswordDialog(self)
+        self.record_activity()
+        if self.aws_manager is None:
+            return
+        dialog = self._get_password_dialog()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_password_data()
             if data is None:
@@ -708,18 +1166,19 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "エラー", "アプリ名、ユーザー名、パスワードは必須です。")
                 return
             
-            # 既存のパスワード一覧を取得して重複チェック
-            existing_passwords = self.aws_manager.get_passwords(self.username)
-            for existing in existing_passwords:
-                if existing['app_name'] == data['app_name']:
-                    QMessageBox.warning(self, "エラー", f"アプリ名 '{data['app_name']}' は既に存在します。")
-                    return
+            # 表示中のパスワード一覧で重複チェック
+            if data['app_name'] in self._passwords_by_app:
+                QMessageBox.warning(self, "エラー", f"アプリ名 '{data['app_name']}' は既に存在します。")
+                return
             
-            if self.aws_manager.save_password(self.username, data):
-                QMessageBox.information(self, "成功", f"パスワード '{data['app_name']}' を追加しました。")
-                self.refresh_table()  # 追加後に更新
-            else:
-                QMessageBox.warning(self, "エラー", "パスワードの保存に失敗しました。")
+            self._start_aws_task(
+                lambda success: self._on_password_saved(
+                    success,
+                    f"パスワード '{data['app_name']}' を追加しました。",
+                    "パスワードの保存に失敗しました。"
+                ),
+                self.aws_manager.save_password, self.username, data
+            )
 
     def edit_password(self, password_data):
         """
@@ -731,18 +1190,41 @@ class MainWindow(QMainWindow):
         Note:
             編集後、テーブルの表示を更新します。
         """
-        dialog = PasswordDialog(self, password_data)
+        if self.aws_manager is None:
+            return
+        dialog = self._get_password_dialog(password_data)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             data = dialog.get_password_data()
+            if data is None:
+                QMessageBox.warning(self, "エラー", "アプリ名には英数字、アンダースコア、ドット、ハイフンのみ使用できます。")
+                return
             if not data['username'] or not data['password']:
                 QMessageBox.warning(self, "エラー", "ユーザー名とパスワードは必須です。")
                 return
             
-            if self.aws_manager.save_password(self.username, data):
-                QMessageBox.information(self, "成功", f"パスワード '{data['app_name']}' を更新しました。")
-                self.refresh_table()  # 編集後に更新
-            else:
-                QMessageBox.warning(self, "エラー", "パスワードの更新に失敗しました。")
+            self._start_aws_task(
+                lambda success: self._on_password_saved(
+                    success,
+                    f"パスワード '{data['app_name']}' を更新しました。",
+                    "パスワードの更新に失敗しました。"
+                ),
+                self.aws_manager.save_password, self.username, data
+            )
+
+    def _on_password_saved(self, success: bool, message: str, error_message: str):
+        """
+        パスワード情報の保存完了時の処理
+
+        Args:
+            success (bool): 保存に成功した場合はTrue
+            message (str): 成功時に表示するメッセージ
+            error_message (str): 失敗時に表示するメッセージ
+        """
+        if success:
+            QMessageBox.information(self, "成功", message)
+            self._reload_passwords()  # 保存後に更新
+        else:
+            QMessageBox.warning(self, "エラー", error_message)
 
     def delete_password(self, app_name):
         """
@@ -754,10 +1236,37 @@ class MainWindow(QMainWindow):
         Note:
             削除後、テーブルの表示を更新します。
         """
-        if self.aws_manager.delete_password(self.username, app_name):
-            self.refresh_table()
+        if self.aws_manager is None:
+            return
+        self._start_aws_task(
+            self._on_password_deleted,
+            self.aws_manager.delete_password, self.username, app_name
+        )
+
+    def _on_password_deleted(self, success: bool):
+        """
+        パスワード情報の削除完了時の処理
+
+        Args:
+            success (bool): 削除に成功した場合はTrue
+        """
+        if success:
+            self._reload_passwords()
         else:
-            QMessageBox.warning(self, "エラー", "パスワードの削除に失敗しました。") 
+            QMessageBox.warning(self, "エラー", "パスワードの削除に失敗しました。")
+
+    def closeEvent(self, event):
+        """
+        ウィンドウを閉じる時の処理
+
+        Args:
+            event (QCloseEvent): クローズイベント
+
+        Note:
+            コピーしたパスワードがクリップボードに残っている場合はクリアします。
+        """
+        self._clear_clipboard()
+        super().closeEvent(event)
 
     def center_window(self):
         """
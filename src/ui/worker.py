@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ワーカースレッド
+
+時間のかかる処理をQThreadPoolのワーカースレッドで実行するためのタスクを提供します。
+
+主な機能:
+- 任意の関数のワーカースレッドでの実行
+- 実行結果のGUIスレッドへの通知（シグナル）
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+class WorkerSignals(QObject):
+    """
+    ワーカースレッドからGUIスレッドへ結果を通知するシグナル
+
+    Signals:
+        finished (object): 処理が成功した場合に結果を通知
+        failed: 処理が失敗した場合に通知
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal()
+
+class Task(QRunnable):
+    def __init__(self, func, *args):
+        """
+        ワーカースレッドで実行するタスクの初期化
+
+        ファイルの読み書きやAWSとの通信をワーカースレッドで実行し、
+        GUIスレッドのイベントループを止めないようにします。
+
+        Args:
+            func (Callable): ワーカースレッドで実行する関数
+            *args: funcに渡す引数
+
+        Attributes:
+            signals (WorkerSignals): 結果通知用のシグナル
+
+        Note:
+            - funcはワーカースレッドで実行されるため、Qtのウィジェットには触れないでください
+            - 結果はシグナルを介して、接続先のスロットにGUIスレッドで渡されます
+        """
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """関数を実行し、結果をシグナルで通知"""
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            print(f"バックグラウンド処理エラー: {e}")
+            self.signals.failed.emit()
+            return
+        self.signals.finished.emit(result)
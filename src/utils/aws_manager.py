@@ -22,10 +22,18 @@ AWSパラメータストア操作用マネージャー
 
 import boto3
 import json
+from bisect import bisect_left
+from operator import itemgetter
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from .credentials_manager import CredentialsManager
 
+# パスワード一覧の並び順のキー（アプリ名順）
+_SORT_KEY = itemgetter('app_name')
+
+# DeleteParametersで一度に削除できるパラメータ数の上限
+_DELETE_BATCH_SIZE = 10
+
 class AWSManager:
     class NoCredentialsError(Exception):
         """認証情報が設定されていない場合のエラー"""
@@ -46,6 +54,8 @@ class AWSManager:
             cache (dict): パスワード情報のキャッシュ
             cache_timestamp (datetime): キャッシュの最終更新時刻
             cache_duration (int): キャッシュの有効期間（秒）
+            _version (int): 保存・削除のたびに増加するデータのバージョン
+            _cache_versions (dict): ユーザーごとのキャッシュ取得時のバージョン
         """
         self.region = region
         self.credentials_manager = CredentialsManager()
@@ -53,16 +63,25 @@ class AWSManager:
         self.cache = {}
         self.cache_timestamp = None
         self.cache_duration = 300  # 5分
+        self._version = 0
+        self._cache_versions = {}
 
-    def _setup_session(self):
+    def _setup_session(self, credentials: Optional[Dict] = None):
         """
         AWSセッションのセットアップ
 
         認証情報を使用してAWSセッションとSystems Managerクライアントを初期化します。
         認証情報が存在しない場合、セッションとクライアントはNoneに設定されます。
+
+        Args:
+            credentials (dict, optional): 読み込み済みの認証情報。
+                指定がない場合は認証情報ファイルから読み込みます。
         """
-        access_key = self.credentials_manager.get_access_key()
-        secret_key = self.credentials_manager.get_secret_key()
+        if credentials is None:
+            credentials = self.credentials_manager.load_credentials()
+        access_key = credentials.get('access_key', '')
+        secret_key = credentials.get('secret_key', '')
+        self._credentials_key = (access_key, secret_key)
         
         if not access_key or not secret_key:
             self.session = None
@@ -76,6 +95,19 @@ class AWSManager:
         )
         self.ssm = self.session.client('ssm')
 
+    def reload_credentials(self):
+        """
+        認証情報を読み込み直す
+
+        Note:
+            認証情報が前回のセットアップ時から変更されていない場合は、
+            既存のセッションとクライアントをそのまま使用します。
+        """
+        credentials = self.credentials_manager.load_credentials()
+        key = (credentials.get('access_key', ''), credentials.get('secret_key', ''))
+        if key != self._credentials_key:
+            self._setup_session(credentials)
+
     def _check_credentials(self):
         """
         認証情報が設定されているか確認
@@ -142,16 +174,18 @@ class AWSManager:
 
         Note:
             - キャッシュが有効な場合はキャッシュから情報を返します
+              （有効期間内で、取得後に保存・削除が行われていない場合）
             - エラーが発生した場合は空のリストを返します
             - 取得したデータは自動的にキャッシュされます
+            - 一覧はアプリ名順に並べて返します（APIの返却順には依存しません）
         """
         try:
             self._check_credentials()
             
-            # キャッシュチェック
-            if self.cache_timestamp and (datetime.now() - self.cache_timestamp).total_seconds() < self.cache_duration:
-                if username in self.cache:
-                    return self._migrate_password_data(self.cache[username])
+            # キャッシュチェック（取得後に保存・削除が行われていなければ再利用）
+            # キャッシュのデータは取得時に移行済みのため、そのまま返す
+            if self._cache_versions.get(username) == self._version and self._is_cache_valid():
+                return self.cache[username]
 
             # ユーザーのルートパスを取得
             root_path = self._get_parameter_path(username)
@@ -188,8 +222,12 @@ class AWSManager:
                 # データ形式の移行
                 passwords = self._migrate_password_data(passwords)
                 
+                # アプリ名順に並べる（APIの返却順は保証されないため、キャッシュの更新と同じ順序に揃える）
+                passwords.sort(key=_SORT_KEY)
+                
                 # キャッシュ更新
                 self.cache[username] = passwords
+                self._cache_versions[username] = self._version
                 self.cache_timestamp = datetime.now()
                 
                 return passwords
@@ -206,6 +244,47 @@ class AWSManager:
             print(f"詳細なエラー情報: {traceback.format_exc()}")  # デバッグ情報
             return []
 
+    def invalidate_cache(self):
+        """
+        パスワード情報のキャッシュを無効化
+
+        Note:
+            データのバージョンを進めるため、次回の get_passwords で最新の情報を取得します。
+        """
+        self._version += 1
+
+    def _update_cache(self, username: str, removed: List[str] = (), added: Optional[Dict] = None):
+        """
+        保存・削除の結果をキャッシュに反映
+
+        Args:
+            username (str): ユーザー名
+            removed (List[str]): キャッシュから取り除くアプリ名のリスト
+            added (Optional[Dict]): キャッシュに追加（同じアプリ名の場合は置き換え）するパスワード情報
+
+        Note:
+            - キャッシュが有効な場合は、AWSから再取得せずにキャッシュの一覧を更新します
+            - 一覧は新しいリストとして置き換えるため、取得済みのリストは変更されません
+            - 一覧は get_passwords でアプリ名順に並べられているため、
+              保存したパスワード情報は既存の位置で置き換え、新規の場合はアプリ名順の位置に挿入します
+            - キャッシュが無効な場合は無効化し、次回の get_passwords で最新の情報を取得します
+        """
+        if self._cache_versions.get(username) != self._version or not self._is_cache_valid():
+            self.invalidate_cache()
+            return
+        
+        passwords = [p for p in self.cache[username] if p['app_name'] not in removed]
+        if added is not None:
+            app_name = added['app_name']
+            index = bisect_left(passwords, app_name, key=_SORT_KEY)
+            if index < len(passwords) and passwords[index]['app_name'] == app_name:
+                # 既存のパスワード情報は同じ位置で置き換える（一覧の並び順を変えない）
+                passwords[index] = added
+            else:
+                # 新規のパスワード情報はアプリ名順の位置に挿入
+                passwords.insert(index, added)
+        self.cache[username] = passwords
+
     def _migrate_password_data(self, passwords: list) -> list:
         """
         古い形式のパスワードデータを新しい形式に移行
@@ -266,7 +345,7 @@ class AWSManager:
 
         Note:
             - パスワード情報はAWSパラメータストアに暗号化して保存されます
-            - 保存後、キャッシュは自動的に更新されます
+            - 保存した内容はキャッシュに反映されます
             - app_nameは必須フィールドです
         """
         try:
@@ -296,10 +375,8 @@ class AWSManager:
                 Overwrite=True
             )
             
-            # キャッシュを更新
-            passwords = self.get_passwords(username)  # 最新のパスワード一覧を取得
-            self.cache[username] = passwords
-            self.cache_timestamp = datetime.now()
+            # 保存した内容をキャッシュに反映（AWSからの再取得を避ける）
+            self._update_cache(username, added=dict(password_data))
             
             return True
             
@@ -319,7 +396,7 @@ class AWSManager:
             bool: 削除に成功した場合はTrue、失敗した場合はFalse
 
         Note:
-            - 削除後、キャッシュは自動的に更新されます
+            - 削除した内容はキャッシュに反映されます
             - 指定されたapp_nameが存在しない場合もTrueを返します
         """
         try:
@@ -329,20 +406,56 @@ class AWSManager:
             parameter_path = self._get_parameter_path(username, app_name)
             self.ssm.delete_parameter(Name=parameter_path)
             
-            # キャッシュを更新
-            passwords = self.get_passwords(username)  # 最新のパスワード一覧を取得
-            self.cache[username] = passwords
-            self.cache_timestamp = datetime.now()
+            # 削除した内容をキャッシュに反映（AWSからの再取得を避ける）
+            self._update_cache(username, [app_name])
             
             return True
             
         except self.ssm.exceptions.ParameterNotFound:
             # パラメータが存在しない場合は成功として扱う
+            self._update_cache(username, [app_name])
             return True
         except Exception as e:
             print(f"パスワード削除エラー: {e}")
             return False
 
+    def delete_passwords(self, username: str, app_names: List[str]) -> bool:
+        """
+        複数のパスワード情報をまとめて削除
+
+        Args:
+            username (str): ユーザー名
+            app_names (List[str]): 削除するアプリ名のリスト
+
+        Returns:
+            bool: 削除に成功した場合はTrue、失敗した場合はFalse
+
+        Note:
+            - 削除は最大10件ずつまとめて1回のリクエストで行われます
+            - 削除した内容はキャッシュに反映されます
+            - 指定されたapp_nameが存在しない場合も成功として扱います
+        """
+        try:
+            self._check_credentials()
+            
+            # パラメータの削除（DeleteParametersは1回あたり最大10件）
+            for i in range(0, len(app_names), _DELETE_BATCH_SIZE):
+                self.ssm.delete_parameters(Names=[
+                    self._get_parameter_path(username, app_name)
+                    for app_name in app_names[i:i + _DELETE_BATCH_SIZE]
+                ])
+            
+            # 削除した内容をキャッシュに反映（AWSからの再取得を避ける）
+            self._update_cache(username, app_names)
+            
+            return True
+            
+        except Exception as e:
+            print(f"パスワード削除エラー: {e}")
+            # 一部のみ削除された可能性があるため、次回は最新の一覧を取得する
+            self.invalidate_cache()
+            return False
+
     def update_credentials(self, access_key: str, secret_key: str):
         """
         AWS認証情報の更新
@@ -77,59 +77,6 @@ class CredentialsManager:
         
         self.cipher_suite = Fernet(key)
 
-    def save_credentials(self, credentials: dict):
-        """
-        AWS認証情報を暗号化して保存
-
-        Args:
-            credentials (dict): AWS認証情報を含む辞書
-                {
-                    'access_key': str,
-                    'secret_key': str,
-                    'region': str (optional)
-                }
-
-        Note:
-            - 認証情報は暗号化されてファイルに保存されます
-            - リージョン情報は設定ファイルに平文で保存されます
-            - 既存の認証情報は上書きされます
-        """
-        # 認証情報の暗号化
-        encrypted_data = self.cipher_suite.encrypt(json.dumps(credentials).encode())
-        
-        # 暗号化されたデータの保存
-        with open(self.credentials_path, 'wb') as f:
-            f.write(encrypted_data)
-
-    def load_credentials(self) -> dict:
-        """
-        暗号化された認証情報を読み込む
-
-        Returns:
-            dict: 認証情報を含む辞書
-                {
-                    'access_key': str,
-                    'secret_key': str,
-                    'region': str
-                }
-
-        Note:
-            - 認証情報が存在しない場合は空の辞書を返します
-            - 復号化に失敗した場合は空の辞書を返します
-            - リージョン情報は設定ファイルから読み込まれます
-        """
-        if not self.credentials_path.exists():
-            return {'access_key': '', 'secret_key': ''}
-        
-        try:
-            with open(self.credentials_path, 'rb') as f:
-                encrypted_data = f.read()
-                decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-                return json.loads(decrypted_data.decode())
-        except Exception as e:
-            print(f"認証情報の読み込みエラー: {e}")
-            return {'access_key': '', 'secret_key': ''}
-
     def get_access_key(self) -> str:
         """
         AWSアクセスキーを取得
@@ -157,9 +104,19 @@ class CredentialsManager:
     def save_credentials(self, credentials: dict):
         """
         AWS認証情報を暗号化して保存
-        
+
         Args:
             credentials (dict): AWS認証情報を含む辞書
+                {
+                    'access_key': str,
+                    'secret_key': str,
+                    'region': str (optional)
+                }
+
+        Note:
+            - 認証情報は暗号化されてファイルに保存されます
+            - リージョン情報は設定ファイルに平文で保存されます
+            - 既存の認証情報は上書きされます
         """
         # 認証情報の暗号化
         encrypted_data = self.cipher_suite.encrypt(json.dumps(credentials).encode())
@@ -183,9 +140,19 @@ class CredentialsManager:
     def load_credentials(self) -> dict:
         """
         暗号化されたAWS認証情報を読み込み
-        
+
         Returns:
             dict: AWS認証情報を含む辞書
+                {
+                    'access_key': str,
+                    'secret_key': str,
+                    'region': str
+                }
+
+        Note:
+            - 認証情報が存在しない場合は空の辞書を返します
+            - 復号化に失敗した場合は空の辞書を返します
+            - リージョン情報は設定ファイルから読み込まれます
         """
         if not self.credentials_path.exists():
             return {}